@@ -0,0 +1,72 @@
+# (c) Copyright, Real-Time Innovations, 2025.  All rights reserved.
+# RTI grants Licensee a license to use, modify, compile, and create derivative
+# works of the software solely for use with RTI Connext DDS. Licensee may
+# redistribute copies of the software provided that all such copies are subject
+# to this license. The software is provided "as is", with no warranty of any
+# type, including any warranty for fitness for any purpose. RTI is under no
+# obligation to maintain or support the software. RTI shall not be liable for
+# any incidental or consequential damages arising out of the use or inability
+# to use the software.
+
+"""QosProvider and DomainParticipant sharing for the Python applications."""
+
+import rti.connextdds as dds
+
+# QosProviders already loaded in this process, keyed by XML file path
+_qos_providers = {}
+
+# DomainParticipants created in this process and their user counts, keyed by
+# (domain_id, QoS file, participant profile, app name)
+_participants = {}
+
+
+def get_qos_provider(qos_file_path: str) -> dds.QosProvider:
+    """Return the QosProvider for qos_file_path, parsing the XML only once"""
+    qos_provider = _qos_providers.get(qos_file_path)
+    if qos_provider is None:
+        qos_provider = dds.QosProvider(qos_file_path)
+        _qos_providers[qos_file_path] = qos_provider
+    return qos_provider
+
+
+def get_participant(
+    domain_id: int, qos_file_path: str, participant_profile: str, app_name: str
+) -> dds.DomainParticipant:
+    """Return this process's participant for the domain and app name, creating it once
+
+    Every call must be paired with release_participant().
+    """
+    key = (domain_id, qos_file_path, participant_profile, app_name)
+    entry = _participants.get(key)
+    if entry is None:
+        participant_qos = get_qos_provider(qos_file_path).participant_qos_from_profile(
+            participant_profile
+        )
+        participant_qos.participant_name.name = app_name
+        entry = [dds.DomainParticipant(domain_id, participant_qos), 0]
+        _participants[key] = entry
+    entry[1] += 1
+    return entry[0]
+
+
+def release_participant(participant: dds.DomainParticipant) -> None:
+    """Drop one user of a participant from get_participant; the last one closes it
+
+    Closing the participant also deletes every Topic, reader and writer
+    created on it.
+    """
+    for key, entry in _participants.items():
+        if entry[0] is participant:
+            entry[1] -= 1
+            if entry[1] == 0:
+                del _participants[key]
+                participant.close()
+            return
+
+
+def find_or_create_topic(participant, topic_name, topic_type):
+    """Reuse a Topic already created on a shared participant"""
+    topic = dds.Topic.find(participant, topic_name)
+    if topic is None:
+        topic = dds.Topic(participant, topic_name, topic_type)
+    return topic
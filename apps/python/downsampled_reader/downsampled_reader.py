@@ -10,6 +10,7 @@
 
 import sys
 import os
+import pathlib
 import argparse
 import rti.connextdds as dds
 import rti.asyncio
@@ -20,16 +21,30 @@ if _gen_dir and os.path.isdir(_gen_dir):
     sys.path.insert(0, _gen_dir)
 else:
     sys.path.insert(
-        0, os.path.join(os.path.dirname(__file__), "..", "..", "..", "dds", "datamodel")
+        0, str(pathlib.Path(__file__).resolve().parents[3] / "dds" / "datamodel")
     )
 
 # Import DDS Data Types, Topics and config constants
 from python_gen.ExampleTypes import example_types
 from python_gen.Definitions import topics, qos_profiles
 
+# Participant and QoS helpers shared by the Python applications
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+from dds_participants import get_qos_provider, get_participant, release_participant, find_or_create_topic
+
 # Application constants
 DEFAULT_APP_NAME = "Downsampled Position Reader"
 
+# Connext verbosity indexed by the --verbosity argument
+VERBOSITY_LEVELS = (
+    dds.Verbosity.SILENT,
+    dds.Verbosity.EXCEPTION,
+    dds.Verbosity.WARNING,
+    dds.Verbosity.STATUS_LOCAL,
+    dds.Verbosity.STATUS_REMOTE,
+    dds.Verbosity.STATUS_ALL,
+)
+
 
 # Define custom listener by inheriting from DataReaderListener
 class PositionReaderListener(dds.DataReaderListener):
@@ -66,77 +81,86 @@ class PositionReaderListener(dds.DataReaderListener):
             print(f"  Last publication handle: {status.last_publication_handle}")
 
 
-async def process_position_data(reader):
+async def process_position_data(reader, quiet=False):
     """Process incoming Position data with 1Hz downsampling"""
+    # Wake through rti.asyncio's dispatcher, which stops its wait cleanly on
+    # shutdown, then drain whatever else is queued and print it in one write
     async for data in reader.take_data_async():
-        print(f"[POSITION_SUBSCRIBER] Position Received:")
-        print(f"  Source ID: {data.source_id}")
-        print(f"  Latitude: {data.latitude}")
-        print(f"  Longitude: {data.longitude}")
-        print(f"  Altitude: {data.altitude}")
-        print(f"  Timestamp: {data.timestamp_sec}")
+        samples = [data]
+        samples.extend(reader.take_data())
+        if quiet:
+            continue
+        sys.stdout.write("".join(
+            f"[POSITION_SUBSCRIBER] Position Received:\n"
+            f"  Source ID: {data.source_id}\n"
+            f"  Latitude: {data.latitude}\n"
+            f"  Longitude: {data.longitude}\n"
+            f"  Altitude: {data.altitude}\n"
+            f"  Timestamp: {data.timestamp_sec}\n"
+            for data in samples
+        ))
 
 
 class DownsampledReaderApp:
 
     @staticmethod
-    async def run(domain_id: int, qos_file_path: str):
+    async def run(domain_id: int, qos_file_path: str, quiet: bool = False):
 
         app_name = DEFAULT_APP_NAME
 
         # Load QoS profiles from the specified file
         print(f"Loading QoS profiles from: {qos_file_path}")
-        qos_provider = dds.QosProvider(qos_file_path)
+        qos_provider = get_qos_provider(qos_file_path)
 
         # Create DomainParticipant with DEFAULT_PARTICIPANT QoS profile
-        participant_qos = qos_provider.participant_qos_from_profile(
-            qos_profiles.DEFAULT_PARTICIPANT
-        )
-
-        participant_qos.participant_name.name = app_name
-        participant = dds.DomainParticipant(domain_id, participant_qos)
-
-        print(
-            f"DomainParticipant created with QoS profile: {qos_profiles.DEFAULT_PARTICIPANT}"
-        )
-        print(f"DOMAIN ID: {domain_id}")
-
-        # Create Position Topic
-        position_topic = dds.Topic(
-            participant, topics.POSITION_TOPIC, example_types.Position
-        )
-
-        # Create DataReader with Status1HzQoS profile (1Hz time-based filter)
-        position_reader_qos = qos_provider.datareader_qos_from_profile(
-            "DataPatternsLibrary::Status1HzQoS"
-        )
-        position_reader = dds.DataReader(
-            participant.implicit_subscriber, 
-            position_topic, 
-            position_reader_qos
-        )
-
-        # Set the listener with the appropriate status mask
-        listener = PositionReaderListener()
-        position_reader.set_listener(
-            listener, 
-            dds.StatusMask.REQUESTED_DEADLINE_MISSED | 
-            dds.StatusMask.SUBSCRIPTION_MATCHED |
-            dds.StatusMask.LIVELINESS_CHANGED
+        # The participant is shared by every run() in this process with the
+        # same app name; release_participant closes it after the last one
+        participant = get_participant(
+            domain_id, qos_file_path, qos_profiles.DEFAULT_PARTICIPANT, app_name
         )
-
-        print("[SUBSCRIBER] RTI Asyncio reader configured for Position data with 1Hz downsampling...")
-        print("[SUBSCRIBER] Listener callbacks enabled:")
-        print("  - on_requested_deadline_missed: Triggers if publisher stops sending data")
-        print("  - on_subscription_matched: Triggers when publishers connect/disconnect")
-        print("  - on_liveliness_changed: Triggers when publisher liveliness changes")
-
-        # Process Position data
-        print("[MAIN] Starting RTI asyncio tasks...")
         try:
-            await process_position_data(position_reader)
-        except KeyboardInterrupt:
-            print("[MAIN] Shutting down RTI asyncio tasks...")
+            print(
+                f"DomainParticipant created with QoS profile: {qos_profiles.DEFAULT_PARTICIPANT}"
+            )
+            print(f"DOMAIN ID: {domain_id}")
+
+            # Create Position Topic
+            position_topic = find_or_create_topic(
+                participant, topics.POSITION_TOPIC, example_types.Position
+            )
+
+            # Create DataReader with Status1HzQoS profile (1Hz time-based filter)
+            position_reader_qos = qos_provider.datareader_qos_from_profile(
+                "DataPatternsLibrary::Status1HzQoS"
+            )
+            position_reader = dds.DataReader(
+                participant.implicit_subscriber, 
+                position_topic, 
+                position_reader_qos
+            )
+
+            # Set the listener with the appropriate status mask
+            listener = PositionReaderListener()
+            position_reader.set_listener(
+                listener, 
+                dds.StatusMask.REQUESTED_DEADLINE_MISSED | 
+                dds.StatusMask.SUBSCRIPTION_MATCHED |
+                dds.StatusMask.LIVELINESS_CHANGED
+            )
+
+            print("[SUBSCRIBER] RTI Asyncio reader configured for Position data with 1Hz downsampling...")
+            print("[SUBSCRIBER] Listener callbacks enabled:")
+            print("  - on_requested_deadline_missed: Triggers if publisher stops sending data")
+            print("  - on_subscription_matched: Triggers when publishers connect/disconnect")
+            print("  - on_liveliness_changed: Triggers when publisher liveliness changes")
+
+            # Process Position data
+            print("[MAIN] Starting RTI asyncio tasks...")
+            await process_position_data(position_reader, quiet)
+        finally:
+            # Close the participant, and everything this run() created on it,
+            # once no other run() in the process is using it
+            release_participant(participant)
 
 
 def main():
@@ -162,26 +186,34 @@ def main():
         help="Path to QoS profiles XML file (default: ../../../dds/qos/DDS_QOS_PROFILES.xml)"
     )
 
-    args = parser.parse_args()
+    parser.add_argument(
+        "--quiet", action="store_true",
+        help="Do not print received samples (they are still taken from the reader)"
+    )
 
-    verbosity_levels = {
-        0: dds.Verbosity.SILENT,
-        1: dds.Verbosity.EXCEPTION,
-        2: dds.Verbosity.WARNING,
-        3: dds.Verbosity.STATUS_LOCAL,
-        4: dds.Verbosity.STATUS_REMOTE,
-        5: dds.Verbosity.STATUS_ALL,
-    }
+    args = parser.parse_args()
 
     # Sets verbosity for Connext Internals to help debugging
-    verbosity = verbosity_levels.get(args.verbosity, dds.Verbosity.EXCEPTION)
+    if 0 <= args.verbosity < len(VERBOSITY_LEVELS):
+        verbosity = VERBOSITY_LEVELS[args.verbosity]
+    else:
+        verbosity = dds.Verbosity.EXCEPTION
     dds.Logger.instance.verbosity = verbosity
 
+    # rti.asyncio.run uses the default event loop policy, so an installed
+    # uvloop takes effect; it is optional and not in requirements.txt
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     try:
         # Run
-        rti.asyncio.run(DownsampledReaderApp.run(domain_id=args.domain_id, qos_file_path=args.qos_file))
+        rti.asyncio.run(DownsampledReaderApp.run(domain_id=args.domain_id, qos_file_path=args.qos_file, quiet=args.quiet))
     except KeyboardInterrupt:
-        pass
+        # Ctrl+C is raised out of rti.asyncio.run, not inside the coroutines
+        print("[MAIN] Shutting down RTI asyncio tasks...")
 
 
 if __name__ == "__main__":
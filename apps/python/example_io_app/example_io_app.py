@@ -11,6 +11,7 @@
 import time
 import sys
 import os
+import pathlib
 import asyncio
 import argparse
 import rti.connextdds as dds
@@ -24,13 +25,17 @@ if _gen_dir and os.path.isdir(_gen_dir):
 else:
     # Fallback: use the checked-in types in dds/datamodel/
     sys.path.insert(
-        0, os.path.join(os.path.dirname(__file__), "..", "..", "..", "dds", "datamodel")
+        0, str(pathlib.Path(__file__).resolve().parents[3] / "dds" / "datamodel")
     )
 
 # Import DDS Data Types, Topics and config constants
 from python_gen.ExampleTypes import example_types
 from python_gen.Definitions import topics, qos_profiles, domains
 
+# Participant and QoS helpers shared by the Python applications
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+from dds_participants import get_qos_provider, get_participant, release_participant, find_or_create_topic
+
 # Application constants
 PUBLISHER_SLEEP_INTERVAL = 2  # seconds for button/config publishing
 # Published well above the downsampled_reader's 1Hz time-based filter so that
@@ -39,173 +44,231 @@ POSITION_PUBLISH_INTERVAL = 0.1  # seconds (10Hz) for position publishing
 MAIN_TASK_SLEEP_INTERVAL = 5  # seconds
 DEFAULT_APP_NAME = "Example Python IO App"
 
-async def process_command_data(reader):
+# Connext verbosity indexed by the --verbosity argument
+VERBOSITY_LEVELS = (
+    dds.Verbosity.SILENT,
+    dds.Verbosity.EXCEPTION,
+    dds.Verbosity.WARNING,
+    dds.Verbosity.STATUS_LOCAL,
+    dds.Verbosity.STATUS_REMOTE,
+    dds.Verbosity.STATUS_ALL,
+)
+
+def advance_tick(loop, tick, interval):
+    """Return the publish deadline after tick, never earlier than now"""
+    # After a stall (GC pause, suspend, slow write) restart the cadence from
+    # now instead of publishing a burst of samples for the missed ticks
+    return max(tick + interval, loop.time())
+
+
+async def sleep_until(loop, deadline):
+    """Sleep until the loop.time() deadline, returning at once if it has passed"""
+    await asyncio.sleep(max(0.0, deadline - loop.time()))
+
+
+async def write_sample(writer, sample, threaded_writes=False):
+    """Write sample, optionally from a worker thread"""
+    if threaded_writes:
+        # write() can block on reliable flow control; run it off the event
+        # loop so the command reader keeps draining
+        await asyncio.to_thread(writer.write, sample)
+    else:
+        writer.write(sample)
+
+
+async def process_command_data(reader, quiet=False):
     """Process incoming Command data"""
-    # Print data as it arrives, suspending the coroutine until data is
-    # available.
+    # Wake through rti.asyncio's dispatcher, which stops its wait cleanly on
+    # shutdown, then drain whatever else is queued and print it in one write
     async for data in reader.take_data_async():
-        # Take all available command samples
-        print(f"[COMMAND_SUBSCRIBER] Command Received:")
-        print(f"  Command ID: {data.command_id}")
-        print(f"  Destination ID: {data.destination_id}")
-        print(f"  Command Type: {data.command_type}")
-        print(f"  Message: {data.message}")
-        print(f"  Urgent: {data.urgent}")
+        samples = [data]
+        samples.extend(reader.take_data())
+        if quiet:
+            continue
+        sys.stdout.write("".join(
+            f"[COMMAND_SUBSCRIBER] Command Received:\n"
+            f"  Command ID: {data.command_id}\n"
+            f"  Destination ID: {data.destination_id}\n"
+            f"  Command Type: {data.command_type}\n"
+            f"  Message: {data.message}\n"
+            f"  Urgent: {data.urgent}\n"
+            for data in samples
+        ))
 
 
 class ExampleIOApp:
 
     @staticmethod
-    async def run(domain_id: int, qos_file_path: str):
+    async def run(domain_id: int, qos_file_path: str, quiet: bool = False, threaded_writes: bool = False):
 
         app_name = DEFAULT_APP_NAME
 
         # Load QoS profiles from the specified file
         print(f"Loading QoS profiles from: {qos_file_path}")
-        qos_provider = dds.QosProvider(qos_file_path)
+        qos_provider = get_qos_provider(qos_file_path)
 
         # A DomainParticipant allows an application to begin communicating in
         # a DDS domain. Typically there is one DomainParticipant per application.
         # DomainParticipant QoS is configured in DDS_QOS_PROFILES.xml
-        participant_qos = qos_provider.participant_qos_from_profile(
-            qos_profiles.DEFAULT_PARTICIPANT
-        )
-
-        participant_qos.participant_name.name = app_name
-        participant = dds.DomainParticipant(domain_id, participant_qos)
-
-        print(
-            f"DomainParticipant created with QoS profile: {qos_profiles.DEFAULT_PARTICIPANT}"
+        # The participant is shared by every run() in this process with the
+        # same app name; release_participant closes it after the last one
+        participant = get_participant(
+            domain_id, qos_file_path, qos_profiles.DEFAULT_PARTICIPANT, app_name
         )
-        print(f"DOMAIN ID: {domain_id}")
+        try:
+            print(
+                f"DomainParticipant created with QoS profile: {qos_profiles.DEFAULT_PARTICIPANT}"
+            )
+            print(f"DOMAIN ID: {domain_id}")
 
-        # Create Topics
-        command_topic = dds.Topic(
-            participant, topics.COMMAND_TOPIC, example_types.Command
-        )
+            # Create Topics
+            command_topic = find_or_create_topic(
+                participant, topics.COMMAND_TOPIC, example_types.Command
+            )
 
-        button_topic = dds.Topic(participant, topics.BUTTON_TOPIC, example_types.Button)
-        position_topic = dds.Topic(
-            participant, topics.POSITION_TOPIC, example_types.Position
-        )
+            button_topic = find_or_create_topic(
+                participant, topics.BUTTON_TOPIC, example_types.Button
+            )
+            position_topic = find_or_create_topic(
+                participant, topics.POSITION_TOPIC, example_types.Position
+            )
 
-        # Create DataReaders with QoS configured from DDS_QOS_PROFILES.xml
-        # Using set_topic_data_reader_qos APUI allows us to use the external Assign QoS Profile
-        # Otherwise can just use the regular datareader_qos_from_profile API
-        command_reader_qos = qos_provider.set_topic_datareader_qos(
-            qos_profiles.ASSIGNER, topics.COMMAND_TOPIC
-        )
-        command_reader = dds.DataReader(
-            participant.implicit_subscriber, command_topic, command_reader_qos
-        )
+            # Create DataReaders with QoS configured from DDS_QOS_PROFILES.xml
+            # Using set_topic_data_reader_qos APUI allows us to use the external Assign QoS Profile
+            # Otherwise can just use the regular datareader_qos_from_profile API
+            command_reader_qos = qos_provider.set_topic_datareader_qos(
+                qos_profiles.ASSIGNER, topics.COMMAND_TOPIC
+            )
+            command_reader = dds.DataReader(
+                participant.implicit_subscriber, command_topic, command_reader_qos
+            )
 
-        # Create DataWriters with QoS configured from DDS_QOS_PROFILES.xml
-        position_writer_qos = qos_provider.set_topic_datawriter_qos(
-            qos_profiles.ASSIGNER, topics.POSITION_TOPIC
-        )
-        position_writer = dds.DataWriter(
-            participant.implicit_publisher, position_topic, position_writer_qos
-        )
+            # Create DataWriters with QoS configured from DDS_QOS_PROFILES.xml
+            position_writer_qos = qos_provider.set_topic_datawriter_qos(
+                qos_profiles.ASSIGNER, topics.POSITION_TOPIC
+            )
+            position_writer = dds.DataWriter(
+                participant.implicit_publisher, position_topic, position_writer_qos
+            )
 
-        button_writer_qos = qos_provider.set_topic_datawriter_qos(
-            qos_profiles.ASSIGNER, topics.BUTTON_TOPIC
-        )
-        button_writer = dds.DataWriter(
-            participant.implicit_publisher, button_topic, button_writer_qos
-        )
+            button_writer_qos = qos_provider.set_topic_datawriter_qos(
+                qos_profiles.ASSIGNER, topics.BUTTON_TOPIC
+            )
+            button_writer = dds.DataWriter(
+                participant.implicit_publisher, button_topic, button_writer_qos
+            )
 
-        print("[SUBSCRIBER] RTI Asyncio reader configured for Command data...")
-        print(
-            "[PUBLISHER] RTI Asyncio writers configured for Position and Button data..."
-        )
+            print("[SUBSCRIBER] RTI Asyncio reader configured for Command data...")
+            print(
+                "[PUBLISHER] RTI Asyncio writers configured for Position and Button data..."
+            )
 
-        # Publisher coroutine for Position, published fast enough to
-        # demonstrate the downsampled_reader's 1Hz time-based filter
-        async def position_publisher_task():
-
-            while True:
-                try:
-                    position_sample = example_types.Position()
-                    position_sample.source_id = app_name
-                    position_sample.latitude = 37.7749
-                    position_sample.longitude = -122.4194
-                    position_sample.altitude = 15.0
-                    position_sample.timestamp_sec = int(time.time())
-
-                    position_writer.write(position_sample)
-                    print(
-                        f"[POSITION_PUBLISHER] Published Position - Source: {position_sample.source_id}, Lat: {position_sample.latitude}, Lon: {position_sample.longitude}, Alt: {position_sample.altitude}"
-                    )
-
-                    await asyncio.sleep(POSITION_PUBLISH_INTERVAL)
-
-                except asyncio.CancelledError:
-                    print("[POSITION_PUBLISHER] Position publisher task cancelled")
-                    break
-                except Exception as e:
-                    print(f"[POSITION_PUBLISHER] Error publishing data: {e}")
-                    await asyncio.sleep(POSITION_PUBLISH_INTERVAL)
-
-            print("[POSITION_PUBLISHER] Position publisher task finished.")
-
-        # Publisher coroutine for Button, Config
-        async def button_publisher_task():
-
-            button_count = 0
-
-            while True:
-                try:
-                    current_time = int(time.time())
-
-                    # Publish Button message
-                    button_sample = example_types.Button()
-                    button_sample.source_id = app_name
-                    button_sample.button_id = "btn_1"
-                    button_sample.button_state = (
-                        example_types.ButtonState.PRESSED
-                    )
-                    button_sample.press_count = button_count
-                    button_sample.last_press_timestamp_sec = current_time
-                    button_sample.hold_duration_sec = 0.0
-
-                    button_writer.write(button_sample)
-                    print(
-                        f"[BUTTON_PUBLISHER] Published Button - ID: {button_sample.button_id}, Count: {button_count}"
-                    )
-
-                    button_count += 1
-
-                    await asyncio.sleep(PUBLISHER_SLEEP_INTERVAL)
-
-                except asyncio.CancelledError:
-                    print("[BUTTON_PUBLISHER] Button publisher task cancelled")
-                    break
-                except Exception as e:
-                    print(f"[BUTTON_PUBLISHER] Error publishing data: {e}")
-                    await asyncio.sleep(PUBLISHER_SLEEP_INTERVAL)
-
-            print("[BUTTON_PUBLISHER] Button publisher task finished.")
-
-        # Main application coroutine
-        async def main_task():
-            count = 0
-            while True:
-                print(f"[MAIN] ExampleIOApp processing loop - iteration {count}")
-
-                count += 1
-                await asyncio.sleep(MAIN_TASK_SLEEP_INTERVAL)
-
-        # Create and run concurrent tasks using RTI asyncio
-        print("[MAIN] Starting RTI asyncio tasks...")
-        try:
+            # Publisher coroutine for Position, published fast enough to
+            # demonstrate the downsampled_reader's 1Hz time-based filter
+            async def position_publisher_task():
+
+                # Only the timestamp changes between publications, so build the
+                # sample once and update it in place
+                position_sample = example_types.Position()
+                position_sample.source_id = app_name
+                position_sample.latitude = 37.7749
+                position_sample.longitude = -122.4194
+                position_sample.altitude = 15.0
+                # The logged fields never change, so format the line once
+                published_message = (
+                    f"[POSITION_PUBLISHER] Published Position - Source: {position_sample.source_id}, Lat: {position_sample.latitude}, Lon: {position_sample.longitude}, Alt: {position_sample.altitude}"
+                )
+
+                # Publish on a fixed cadence measured from the loop clock so the
+                # time spent writing does not stretch the interval
+                loop = asyncio.get_running_loop()
+                next_tick = loop.time()
+
+                while True:
+                    try:
+                        position_sample.timestamp_sec = time.time_ns() // 1_000_000_000
+
+                        await write_sample(position_writer, position_sample, threaded_writes)
+                        if not quiet:
+                            print(published_message)
+
+                        next_tick = advance_tick(loop, next_tick, POSITION_PUBLISH_INTERVAL)
+                        await sleep_until(loop, next_tick)
+
+                    except asyncio.CancelledError:
+                        print("[POSITION_PUBLISHER] Position publisher task cancelled")
+                        break
+                    except Exception as e:
+                        print(f"[POSITION_PUBLISHER] Error publishing data: {e}")
+                        next_tick = advance_tick(loop, next_tick, POSITION_PUBLISH_INTERVAL)
+                        await sleep_until(loop, next_tick)
+
+                print("[POSITION_PUBLISHER] Position publisher task finished.")
+
+            # Publisher coroutine for Button, Config
+            async def button_publisher_task():
+
+                button_count = 0
+
+                button_sample = example_types.Button()
+                button_sample.source_id = app_name
+                button_sample.button_id = "btn_1"
+                button_sample.button_state = example_types.ButtonState.PRESSED
+                button_sample.hold_duration_sec = 0.0
+
+                loop = asyncio.get_running_loop()
+                next_tick = loop.time()
+
+                while True:
+                    try:
+                        current_time = time.time_ns() // 1_000_000_000
+
+                        # Publish Button message
+                        button_sample.press_count = button_count
+                        button_sample.last_press_timestamp_sec = current_time
+
+                        await write_sample(button_writer, button_sample, threaded_writes)
+                        if not quiet:
+                            print(
+                                f"[BUTTON_PUBLISHER] Published Button - ID: {button_sample.button_id}, Count: {button_count}"
+                            )
+
+                        button_count += 1
+
+                        next_tick = advance_tick(loop, next_tick, PUBLISHER_SLEEP_INTERVAL)
+                        await sleep_until(loop, next_tick)
+
+                    except asyncio.CancelledError:
+                        print("[BUTTON_PUBLISHER] Button publisher task cancelled")
+                        break
+                    except Exception as e:
+                        print(f"[BUTTON_PUBLISHER] Error publishing data: {e}")
+                        next_tick = advance_tick(loop, next_tick, PUBLISHER_SLEEP_INTERVAL)
+                        await sleep_until(loop, next_tick)
+
+                print("[BUTTON_PUBLISHER] Button publisher task finished.")
+
+            # Main application coroutine
+            async def main_task():
+                count = 0
+                while True:
+                    print(f"[MAIN] ExampleIOApp processing loop - iteration {count}")
+
+                    count += 1
+                    await asyncio.sleep(MAIN_TASK_SLEEP_INTERVAL)
+
+            # Create and run concurrent tasks using RTI asyncio
+            print("[MAIN] Starting RTI asyncio tasks...")
             await asyncio.gather(
                 position_publisher_task(),
                 button_publisher_task(),
-                process_command_data(command_reader),
+                process_command_data(command_reader, quiet),
                 main_task(),
             )
-        except KeyboardInterrupt:
-            print("[MAIN] Shutting down RTI asyncio tasks...")
+        finally:
+            # Close the participant, and everything this run() created on it,
+            # once no other run() in the process is using it
+            release_participant(participant)
 
 
 def main():
@@ -231,26 +294,39 @@ def main():
         help="Path to QoS profiles XML file (default: ../../../dds/qos/DDS_QOS_PROFILES.xml)"
     )
 
-    args = parser.parse_args()
+    parser.add_argument(
+        "--quiet", action="store_true",
+        help="Do not print per-sample publish/receive messages"
+    )
 
-    verbosity_levels = {
-        0: dds.Verbosity.SILENT,
-        1: dds.Verbosity.EXCEPTION,
-        2: dds.Verbosity.WARNING,
-        3: dds.Verbosity.STATUS_LOCAL,
-        4: dds.Verbosity.STATUS_REMOTE,
-        5: dds.Verbosity.STATUS_ALL,
-    }
+    parser.add_argument(
+        "--threaded-writes", action="store_true",
+        help="Write samples from a worker thread (for RELIABLE writers that may block)"
+    )
+
+    args = parser.parse_args()
 
     # Sets verbosity for Connext Internals to help debugging
-    verbosity = verbosity_levels.get(args.verbosity, dds.Verbosity.EXCEPTION)
+    if 0 <= args.verbosity < len(VERBOSITY_LEVELS):
+        verbosity = VERBOSITY_LEVELS[args.verbosity]
+    else:
+        verbosity = dds.Verbosity.EXCEPTION
     dds.Logger.instance.verbosity = verbosity
 
+    # rti.asyncio.run uses the default event loop policy, so an installed
+    # uvloop takes effect; it is optional and not in requirements.txt
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     try:
         # Run
-        rti.asyncio.run(ExampleIOApp.run(domain_id=args.domain_id, qos_file_path=args.qos_file))
+        rti.asyncio.run(ExampleIOApp.run(domain_id=args.domain_id, qos_file_path=args.qos_file, quiet=args.quiet, threaded_writes=args.threaded_writes))
     except KeyboardInterrupt:
-        pass
+        # Ctrl+C is raised out of rti.asyncio.run, not inside the coroutines
+        print("[MAIN] Shutting down RTI asyncio tasks...")
 
 
 if __name__ == "__main__":
@@ -27,8 +27,13 @@ if [ ! -f "$BINDINGS_FILE" ]; then
     
     mkdir -p "$REPO_ROOT/build"
     cd "$REPO_ROOT/build"
-    cmake ..
-    cmake --build .
+    # Prefer Ninja on a fresh build tree; an existing cache keeps its generator.
+    if [ ! -f CMakeCache.txt ] && command -v ninja >/dev/null 2>&1; then
+        cmake -G Ninja ..
+    else
+        cmake ..
+    fi
+    cmake --build . --parallel "$(python_env_build_jobs)"
     cd "$SCRIPT_DIR"
     
     if [ ! -f "$BINDINGS_FILE" ]; then
@@ -8,9 +8,10 @@
 # any incidental or consequential damages arising out of the use or inability
 # to use the software.
 
-import time
+import ctypes
 import sys
 import os
+import pathlib
 import asyncio
 import argparse
 import rti.connextdds as dds
@@ -22,7 +23,7 @@ if _gen_dir and os.path.isdir(_gen_dir):
     sys.path.insert(0, _gen_dir)
 else:
     sys.path.insert(
-        0, os.path.join(os.path.dirname(__file__), "..", "..", "..", "dds", "datamodel")
+        0, str(pathlib.Path(__file__).resolve().parents[3] / "dds" / "datamodel")
     )
 
 # Import DDS Data Types, Topics and config constants
@@ -36,25 +37,54 @@ DEFAULT_APP_NAME = "Large Data Python App"
 IMAGE_WIDTH = 640
 IMAGE_HEIGHT = 480
 IMAGE_SIZE = IMAGE_WIDTH * IMAGE_HEIGHT * 3  # RGB format (3 bytes per pixel) = ~921KB
+CONSOLE_QUEUE_SIZE = 1024  # messages buffered for console_task before dropping
 
-async def process_image_data(reader):
+
+def post_message(console_queue, message):
+    """Queue a console message, dropping it if the console is backed up"""
+    try:
+        console_queue.put_nowait(message)
+    except asyncio.QueueFull:
+        pass
+
+
+async def console_task(console_queue):
+    """Print queued messages so console I/O stays off the publish/receive paths"""
+    while True:
+        # Coalesce everything queued since the last wakeup into one write
+        messages = [await console_queue.get()]
+        while not console_queue.empty():
+            messages.append(console_queue.get_nowait())
+        messages.append("")
+        sys.stdout.write("\n".join(messages))
+
+
+async def process_image_data(reader, console_queue, quiet=False):
     """Process incoming Image data"""
-    # Print data as it arrives, suspending the coroutine until data is
-    # available.
+    # Report data as it arrives, suspending the coroutine until data is
+    # available. Whatever else is already queued joins the same message.
     async for data in reader.take_data_async():
-        # Take all available image samples
-        print(f"[IMAGE_SUBSCRIBER] Image Received:")
-        print(f"  Image ID: {data.image_id}")
-        print(f"  Width: {data.width}")
-        print(f"  Height: {data.height}")
-        print(f"  Format: {data.format}")
-        print(f"  Data Size: {len(data.data)} bytes")
+        if quiet:
+            continue
+        samples = [data]
+        samples.extend(reader.take_data())
+        # data.data is a Uint8Seq exposing the buffer protocol; size it
+        # through a memoryview rather than touching individual elements
+        post_message(console_queue, "\n".join(
+            f"[IMAGE_SUBSCRIBER] Image Received:\n"
+            f"  Image ID: {data.image_id}\n"
+            f"  Width: {data.width}\n"
+            f"  Height: {data.height}\n"
+            f"  Format: {data.format}\n"
+            f"  Data Size: {memoryview(data.data).nbytes} bytes"
+            for data in samples
+        ))
 
 
 class LargeDataApp:
 
     @staticmethod
-    async def run(domain_id: int, qos_file_path: str):
+    async def run(domain_id: int, qos_file_path: str, quiet: bool = False):
 
         app_name = DEFAULT_APP_NAME
 
@@ -98,31 +128,44 @@ class LargeDataApp:
         print("[SUBSCRIBER] RTI Asyncio reader configured for Image data (Large Data with SHMEM)...")
         print("[PUBLISHER] RTI Asyncio writer configured for Image data (Large Data with SHMEM)...")
 
+        # Console output from the publisher and subscriber is queued here
+        # and printed by console_task
+        console_queue = asyncio.Queue(maxsize=CONSOLE_QUEUE_SIZE)
+
         # Publisher coroutine for Image
         async def publisher_task():
 
             image_count = 0
 
+            # Preallocated payload, refilled in place with one memset per frame
+            # instead of building a list of IMAGE_SIZE Python ints
+            image_data = bytearray(IMAGE_SIZE)
+            image_data_buffer = (ctypes.c_char * IMAGE_SIZE).from_buffer(image_data)
+
+            # Only the ID and payload contents change between frames, so the
+            # sample is built once; it holds image_data by reference
+            image_sample = example_types.Image()
+            image_sample.width = IMAGE_WIDTH
+            image_sample.height = IMAGE_HEIGHT
+            image_sample.format = "RGB"
+            image_sample.data = image_data
+
             while True:
                 try:
-                    current_time = int(time.time())
-
                     # Publish Image message with large data payload
-                    image_sample = example_types.Image()
                     image_sample.image_id = f"img_{image_count:06d}"
-                    image_sample.width = IMAGE_WIDTH
-                    image_sample.height = IMAGE_HEIGHT
-                    image_sample.format = "RGB"
-                    
+
                     # Create simulated image data (pattern based on count for variety)
                     # In real application, this would be actual camera/sensor data
                     pattern_value = (image_count % 256)
-                    image_sample.data = [pattern_value] * IMAGE_SIZE
+                    ctypes.memset(image_data_buffer, pattern_value, IMAGE_SIZE)
 
                     image_writer.write(image_sample)
-                    print(
-                        f"[IMAGE_PUBLISHER] Published Image - ID: {image_sample.image_id}, Size: {len(image_sample.data)} bytes"
-                    )
+                    if not quiet:
+                        post_message(
+                            console_queue,
+                            f"[IMAGE_PUBLISHER] Published Image - ID: {image_sample.image_id}, Size: {IMAGE_SIZE} bytes",
+                        )
 
                     image_count += 1
 
@@ -150,7 +193,10 @@ class LargeDataApp:
         print("[MAIN] Starting RTI asyncio tasks...")
         try:
             await asyncio.gather(
-                publisher_task(), process_image_data(image_reader), main_task()
+                publisher_task(),
+                process_image_data(image_reader, console_queue, quiet),
+                console_task(console_queue),
+                main_task(),
             )
         except KeyboardInterrupt:
             print("[MAIN] Shutting down RTI asyncio tasks...")
@@ -179,6 +225,11 @@ def main():
         help="Path to QoS profiles XML file (default: ../../../dds/qos/DDS_QOS_PROFILES.xml)"
     )
 
+    parser.add_argument(
+        "--quiet", action="store_true",
+        help="Do not print per-sample publish/receive messages"
+    )
+
     args = parser.parse_args()
 
     verbosity_levels = {
@@ -194,9 +245,17 @@ def main():
     verbosity = verbosity_levels.get(args.verbosity, dds.Verbosity.EXCEPTION)
     dds.Logger.instance.verbosity = verbosity
 
+    # rti.asyncio.run uses the default event loop policy, so an installed
+    # uvloop takes effect; it is optional and not in requirements.txt
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     try:
         # Run
-        rti.asyncio.run(LargeDataApp.run(domain_id=args.domain_id, qos_file_path=args.qos_file))
+        rti.asyncio.run(LargeDataApp.run(domain_id=args.domain_id, qos_file_path=args.qos_file, quiet=args.quiet))
     except KeyboardInterrupt:
         pass
 
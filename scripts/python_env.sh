@@ -163,6 +163,13 @@ PY
     fi
 }
 
+python_env_build_jobs() {
+    nproc 2>/dev/null \
+        || getconf _NPROCESSORS_ONLN 2>/dev/null \
+        || sysctl -n hw.ncpu 2>/dev/null \
+        || echo 4
+}
+
 python_env_detect_rti_python_version() {
     "$PYTHON_ENV_VENV_PYTHON" - <<'PY'
 import importlib.metadata
@@ -178,6 +185,28 @@ python_env_generated_rtiddsgen_version() {
     fi
 }
 
+python_env_codegen_digest() {
+    local idl_dir="${1:?python_env_codegen_digest requires an IDL directory}"
+    shift
+
+    "$PYTHON_ENV_VENV_PYTHON" - "$idl_dir" "$@" <<'PY'
+import hashlib
+import pathlib
+import sys
+
+idl_dir = pathlib.Path(sys.argv[1])
+digest = hashlib.sha256()
+for salt in sys.argv[2:]:
+    digest.update(salt.encode())
+    digest.update(b"\0")
+for idl_file in sorted(idl_dir.glob("*.idl")):
+    digest.update(idl_file.name.encode())
+    digest.update(b"\0")
+    digest.update(idl_file.read_bytes())
+print(digest.hexdigest())
+PY
+}
+
 python_env_ensure_versioned_types() {
     python_env_log_step "Checking versioned Python type support"
 
@@ -190,6 +219,11 @@ python_env_ensure_versioned_types() {
     local idl_file
     local idl_basename
     local generated_version
+    local stamp_file
+    local codegen_digest
+    local types_cache_fresh
+    local -a missing_files
+    local -a rtiddsgen_args
 
     if ! rti_python_version="$(python_env_detect_rti_python_version)" || [[ -z "$rti_python_version" ]]; then
         echo "ERROR: Cannot detect rti.connext version. Is the package installed?"
@@ -201,8 +235,27 @@ python_env_ensure_versioned_types() {
     types_cache_dir="$PYTHON_ENV_REPO_ROOT/build/dds/python_types"
     versioned_dir="$types_cache_dir/$rti_python_version/python_gen"
     idl_dir="$PYTHON_ENV_REPO_ROOT/dds/datamodel/idl"
+    stamp_file="$versioned_dir/.codegen.stamp"
+    codegen_digest=""
+    types_cache_fresh=false
+
+    if [[ -f "$versioned_dir/ExampleTypes.py" && -f "$stamp_file" ]]; then
+        # Fast path: nothing in the IDL directory (files or the directory
+        # itself, which changes when IDLs are added or removed) is newer
+        # than the stamp, so skip hashing entirely
+        if [[ -z "$(find "$idl_dir" -newer "$stamp_file" -print -quit)" ]]; then
+            types_cache_fresh=true
+        else
+            codegen_digest="$(python_env_codegen_digest "$idl_dir" "$rti_python_version" "$NDDSHOME")"
+            if [[ "$(<"$stamp_file")" == "$codegen_digest" ]]; then
+                # Touched but unchanged; refresh the stamp for the fast path
+                touch "$stamp_file"
+                types_cache_fresh=true
+            fi
+        fi
+    fi
 
-    if [[ -f "$versioned_dir/ExampleTypes.py" ]]; then
+    if [[ "$types_cache_fresh" == true ]]; then
         generated_version="$(python_env_generated_rtiddsgen_version "$versioned_dir/ExampleTypes.py")"
         echo "Using cached Python types: $versioned_dir"
         if [[ -n "$generated_version" ]]; then
@@ -221,16 +274,19 @@ python_env_ensure_versioned_types() {
         mkdir -p "$versioned_dir"
         xtypes_mask=$("$PYTHON_ENV_VENV_PYTHON" -c "import rti.connextdds as dds; print(hex(int(dds.compliance.get_xtypes_mask())))" 2>/dev/null || true)
 
+        rtiddsgen_args=(-language Python -d "$versioned_dir" -I "$idl_dir")
+        if [[ -n "$xtypes_mask" ]]; then
+            rtiddsgen_args+=(-xTypesComplianceMask "$xtypes_mask")
+        fi
+
+        # rtiddsgen writes straight to the terminal so progress and errors
+        # show up as they happen, and a failing run stops the launcher.
         for idl_file in "$idl_dir"/*.idl; do
             idl_basename=$(basename "$idl_file" .idl)
             echo "  Generating: $idl_basename..."
-            if [[ -n "$xtypes_mask" ]]; then
-                "$rtiddsgen" -language Python -d "$versioned_dir" \
-                    -I "$idl_dir" -xTypesComplianceMask "$xtypes_mask" \
-                    "$idl_file" -replace 2>&1 | grep -v "^$" || true
-            else
-                "$rtiddsgen" -language Python -d "$versioned_dir" \
-                    -I "$idl_dir" "$idl_file" -replace 2>&1 | grep -v "^$" || true
+            if ! "$rtiddsgen" "${rtiddsgen_args[@]}" "$idl_file" -replace; then
+                echo "ERROR: rtiddsgen failed for $idl_file"
+                return 1
             fi
         done
 
@@ -238,10 +294,23 @@ python_env_ensure_versioned_types() {
             touch "$versioned_dir/__init__.py"
         fi
 
-        if [[ ! -f "$versioned_dir/ExampleTypes.py" ]]; then
-            echo "ERROR: Type generation failed. ExampleTypes.py not created."
+        # Check every IDL produced a module
+        missing_files=()
+        for idl_file in "$idl_dir"/*.idl; do
+            idl_basename="${idl_file##*/}"
+            idl_basename="${idl_basename%.idl}"
+            if [[ ! -f "$versioned_dir/$idl_basename.py" ]]; then
+                missing_files+=("$idl_basename.py")
+            fi
+        done
+        if [[ ${#missing_files[@]} -gt 0 ]]; then
+            echo "ERROR: Type generation failed. Not created: ${missing_files[*]}"
             return 1
         fi
+        if [[ -z "$codegen_digest" ]]; then
+            codegen_digest="$(python_env_codegen_digest "$idl_dir" "$rti_python_version" "$NDDSHOME")"
+        fi
+        printf '%s\n' "$codegen_digest" > "$stamp_file"
 
         generated_version="$(python_env_generated_rtiddsgen_version "$versioned_dir/ExampleTypes.py")"
         echo "Generated Python types at: $versioned_dir"
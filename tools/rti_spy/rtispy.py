@@ -1,6 +1,12 @@
+import collections
+import datetime
 import glob
+import itertools
+import operator
 import os
+import socket
 import sys
+import threading
 import rti.connextdds as dds
 import time
 import argparse
@@ -14,22 +20,51 @@ from textual.logging import TextualHandler
 import asyncio
 import rti.asyncio
 
+# Info/debug records are only written once configure_logging attaches the
+# debug log; until then the level check skips building them
 logging.basicConfig(
-    level="NOTSET",
+    level="WARNING",
     handlers=[TextualHandler()],
 )
 
 # Global maps
 endpoints = {}
 participants = {}
+# Secondary index of endpoints: participant key -> {endpoint key -> Endpoint}
+endpoints_by_participant = {}
+# Secondary index of endpoints: (participant key, topic name) -> {endpoint key -> Endpoint}
+endpoints_by_topic = {}
+# Endpoint key -> (Endpoint, SubscriberQos or None, DataReaderQos), see matching_reader_qos
+matching_qos_cache = {}
+# (DomainParticipant, SubscriberQos, Subscriber) shared by readers with the same QoS
+shared_subscribers = []
+# create_topic_subscription runs on worker threads, so subscriber and topic
+# find-or-create lookups are serialized
+shared_subscribers_lock = threading.Lock()
+# (DomainParticipant, request key, response key, DataWriter, DataReader), see command_channel
+command_channels = []
+# Invocation IDs for command requests; each command gets its own so replies
+# to overlapping commands are never confused
+command_invocations = itertools.count(int(time.time()))
+
+# Participant factory QoS used while create_participant attaches the builtin
+# listeners (entities start disabled) and the one restored afterwards
+deferred_enable_factory_qos = dds.DomainParticipantFactoryQos()
+deferred_enable_factory_qos.entity_factory.autoenable_created_entities = False
+autoenable_factory_qos = dds.DomainParticipantFactoryQos()
+autoenable_factory_qos.entity_factory.autoenable_created_entities = True
 
 
 def configure_logging(debug_log_path=None):
-  """Attach an optional file handler for discovery/subscription diagnostics."""
+  """Attach an optional file handler for discovery/subscription diagnostics.
+
+  Info and debug records are enabled only while such a handler is attached.
+  """
   if not debug_log_path:
     return
 
   root_logger = logging.getLogger()
+  root_logger.setLevel(logging.NOTSET)
   normalized_path = os.path.abspath(debug_log_path)
   for handler in root_logger.handlers:
     if getattr(handler, "_rti_spy_log_path", None) == normalized_path:
@@ -72,6 +107,43 @@ def configure_type_lookup_qos(qos):
     return False
 
 
+def configure_startup_discovery_qos(qos):
+  """Send the initial participant announcements back to back so peers answer sooner."""
+  try:
+    discovery_config = qos.discovery_config
+    # Connext spaces the initial announcements randomly up to 1 s apart by
+    # default; cap that at 100 ms so existing participants learn about the
+    # spy (and announce themselves back) within the first half second
+    discovery_config.max_initial_participant_announcement_period = dds.Duration.from_milliseconds(100)
+    return True
+  except Exception:
+    return False
+
+
+def configure_discovery_reader_limits(qos, max_samples=4096):
+  """Bound the queues of the builtin discovery readers.
+
+  DDS: The queued samples are taken as soon as they arrive, so the bound
+  only matters during a burst; a full queue makes the reliable builtin
+  writers resend later rather than dropping discovery data.
+  """
+  try:
+    discovery_config = qos.discovery_config
+    for limits in (discovery_config.participant_reader_resource_limits,
+                   discovery_config.publication_reader_resource_limits,
+                   discovery_config.subscription_reader_resource_limits):
+      limits.max_samples = max_samples
+      limits.max_infos = max_samples
+    return True
+  except Exception:
+    return False
+
+
+def builtin_key(key):
+  """Return a BuiltinTopicKey as 16 hashable bytes for use as a registry key."""
+  return bytes(memoryview(key.value))
+
+
 def merge_endpoint(existing, incoming):
   if existing is None:
     return incoming
@@ -94,15 +166,40 @@ def merge_endpoint(existing, incoming):
   )
 
 
+def store_endpoint(endpoint):
+  """Merge a discovered endpoint into the registries and return the entry it replaced."""
+  key = endpoint.key
+  existing = endpoints.get(key)
+  merged = merge_endpoint(existing, endpoint)
+  endpoints[key] = merged
+  if existing is not None and existing.p_key != merged.p_key:
+    endpoints_by_participant.get(existing.p_key, {}).pop(key, None)
+  if existing is not None and (existing.p_key, existing.topic_name) != (merged.p_key, merged.topic_name):
+    endpoints_by_topic.get((existing.p_key, existing.topic_name), {}).pop(key, None)
+  endpoints_by_participant.setdefault(merged.p_key, {})[key] = merged
+  endpoints_by_topic.setdefault((merged.p_key, merged.topic_name), {})[key] = merged
+  return existing
+
+
+def participant_endpoints(p_key):
+  """Return the discovered endpoints owned by one participant."""
+  return endpoints_by_participant.get(p_key, {}).values()
+
+
+def participant_topic_endpoint(p_key, topic_name):
+  """Return one endpoint of a participant on topic_name, or None."""
+  return next(iter(endpoints_by_topic.get((p_key, topic_name), {}).values()), None)
+
+
 def create_participant(domain_id, name="RTI SPY"):
   """Create a participant with builtin publication/subscription listeners attached."""
-  participant_factory_qos = dds.DomainParticipantFactoryQos()
-  participant_factory_qos.entity_factory.autoenable_created_entities = False
-  dds.DomainParticipant.participant_factory_qos = participant_factory_qos
+  dds.DomainParticipant.participant_factory_qos = deferred_enable_factory_qos
 
   qos = dds.DomainParticipantQos()
   qos.participant_name.name = name
   configure_type_lookup_qos(qos)
+  configure_startup_discovery_qos(qos)
+  configure_discovery_reader_limits(qos)
 
   try:
     participant = dds.DomainParticipant(domain_id, qos=qos)
@@ -110,19 +207,22 @@ def create_participant(domain_id, name="RTI SPY"):
     participant.subscription_reader.set_listener(SubscriptionListener(), dds.StatusMask.DATA_AVAILABLE)
     participant.enable()
   finally:
-    participant_factory_qos.entity_factory.autoenable_created_entities = True
-    dds.DomainParticipant.participant_factory_qos = participant_factory_qos
+    dds.DomainParticipant.participant_factory_qos = autoenable_factory_qos
   return participant
 
 
-def create_topic_subscription(participant, endpoint):
-  """Create a DynamicData subscription that matches a discovered writer endpoint."""
-  if not endpoint.type:
-    raise ValueError("No type information available for this topic.")
-  if not isinstance(endpoint.type, dds.DynamicType):
-    raise TypeError("Discovered type is not a DynamicType.")
+def matching_reader_qos(endpoint):
+  """Return (SubscriberQos or None, DataReaderQos) compatible with a discovered writer endpoint.
 
-  dynamic_topic = dds.DynamicData.Topic(participant, endpoint.topic_name, endpoint.type)
+  DDS: The reader drives matching - it must request equal or "lower" QoS than
+  the writer offers, and partitions must overlap. Mirroring the writer's
+  policies always satisfies that. Results are cached per Endpoint; discovery
+  replaces the Endpoint object when its QoS changes, so identity marks a
+  stale entry.
+  """
+  cached = matching_qos_cache.get(endpoint.key)
+  if cached is not None and cached[0] is endpoint:
+    return cached[1], cached[2]
 
   subscriber_qos = dds.SubscriberQos()
   qos_set = False
@@ -130,16 +230,12 @@ def create_topic_subscription(participant, endpoint):
   if endpoint.partition:
     subscriber_qos.partition.name = endpoint.partition.name
     qos_set = True
-    logging.info(f"[create_topic_subscription] Setting subscriber partitions: {', '.join(endpoint.partition.name)}")
 
   if endpoint.presentation:
     subscriber_qos.presentation.access_scope = endpoint.presentation.access_scope
     subscriber_qos.presentation.coherent_access = endpoint.presentation.coherent_access
     subscriber_qos.presentation.ordered_access = endpoint.presentation.ordered_access
     qos_set = True
-    logging.info(f"[create_topic_subscription] Setting subscriber presentation: access_scope={endpoint.presentation.access_scope}")
-
-  subscriber = dds.Subscriber(participant, subscriber_qos) if qos_set else dds.Subscriber(participant)
 
   reader_qos = dds.DataReaderQos()
   if endpoint.reliability:
@@ -152,18 +248,188 @@ def create_topic_subscription(participant, endpoint):
   if endpoint.ownership:
     reader_qos.ownership.kind = endpoint.ownership.kind
 
+  subscriber_qos = subscriber_qos if qos_set else None
+  matching_qos_cache[endpoint.key] = (endpoint, subscriber_qos, reader_qos)
+  return subscriber_qos, reader_qos
+
+
+def shared_subscriber(participant, subscriber_qos):
+  """Return a Subscriber on participant with subscriber_qos, reusing one already created.
+
+  DDS: Subscribers are only distinguished by partition/presentation QoS, so
+  readers that agree on it share one instead of each creating (and
+  announcing) their own. None selects the participant's implicit subscriber.
+  Shared subscribers are left open for the participant to clean up.
+  """
+  if subscriber_qos is None:
+    return participant.implicit_subscriber
+
+  with shared_subscribers_lock:
+    shared_subscribers[:] = [entry for entry in shared_subscribers if not entry[2].closed]
+    for owner, qos, subscriber in shared_subscribers:
+      if owner is participant and qos == subscriber_qos:
+        return subscriber
+
+    subscriber = dds.Subscriber(participant, subscriber_qos)
+    shared_subscribers.append((participant, subscriber_qos, subscriber))
+    return subscriber
+
+
+def create_topic_subscription(participant, endpoint):
+  """Create a DynamicData subscription that matches a discovered writer endpoint."""
+  if not endpoint.type:
+    raise ValueError("No type information available for this topic.")
+  if not isinstance(endpoint.type, dds.DynamicType):
+    raise TypeError("Discovered type is not a DynamicType.")
+
+  # The topic may already exist, e.g. from an earlier subscription or the logger dialog
+  topic = dynamic_topic(participant, endpoint.topic_name, endpoint.type)
+
+  subscriber_qos, reader_qos = matching_reader_qos(endpoint)
+
+  if endpoint.partition:
+    logging.info("[create_topic_subscription] Setting subscriber partitions: %s", ", ".join(endpoint.partition.name))
+  if endpoint.presentation:
+    logging.info("[create_topic_subscription] Setting subscriber presentation: access_scope=%s", endpoint.presentation.access_scope)
+
+  subscriber = shared_subscriber(participant, subscriber_qos)
+
   if endpoint.reliability:
     logging.info(
-      f"[create_topic_subscription] Applying QoS - Reliability: {endpoint.reliability.kind}, "
-      f"Durability: {endpoint.durability.kind if endpoint.durability else 'N/A'}, "
-      f"Ownership: {endpoint.ownership.kind if endpoint.ownership else 'N/A'}"
+      "[create_topic_subscription] Applying QoS - Reliability: %s, Durability: %s, Ownership: %s",
+      endpoint.reliability.kind,
+      endpoint.durability.kind if endpoint.durability else 'N/A',
+      endpoint.ownership.kind if endpoint.ownership else 'N/A',
     )
-    dynamic_reader = dds.DynamicData.DataReader(subscriber, dynamic_topic, reader_qos)
+    dynamic_reader = dds.DynamicData.DataReader(subscriber, topic, reader_qos)
   else:
-    dynamic_reader = dds.DynamicData.DataReader(subscriber, dynamic_topic)
+    dynamic_reader = dds.DynamicData.DataReader(subscriber, topic)
+
+  logging.info("[create_topic_subscription] Subscribed to topic '%s'", endpoint.topic_name)
+  return subscriber, topic, dynamic_reader
+
+
+def close_created_subscription(creation):
+  """Done-callback that closes a create_topic_subscription() reader nobody awaited."""
+  if creation.cancelled() or creation.exception() is not None:
+    return
+  _, _, dynamic_reader = creation.result()
+  if not dynamic_reader.closed:
+    dynamic_reader.close()
+
 
-  logging.info(f"[create_topic_subscription] Subscribed to topic '{endpoint.topic_name}'")
-  return subscriber, dynamic_topic, dynamic_reader
+def dynamic_topic(participant, name, dynamic_type):
+  """Return participant's DynamicData Topic called name, creating it on first use."""
+  # A worker thread and the UI loop may look up the same topic at once; the
+  # one that loses an unlocked race would fail to create a duplicate Topic
+  with shared_subscribers_lock:
+    topic = dds.DynamicData.Topic.find(participant, name)
+    if topic is None:
+      topic = dds.DynamicData.Topic(participant, name, dynamic_type)
+    return topic
+
+
+def command_channel(participant, request_endpoint, response_endpoint):
+  """Return (request DataWriter, response DataReader) for a target's distlog command endpoints.
+
+  DDS: The pair is cached per participant and endpoint pair; recreating it
+  for every command would repeat the matching handshake with the target.
+  """
+  for owner, request_key, response_key, request_writer, response_reader in command_channels:
+    if (owner is participant and request_key == request_endpoint.key and
+        response_key == response_endpoint.key and
+        not request_writer.closed and not response_reader.closed):
+      return request_writer, response_reader
+
+  # DDS: Create topics using DynamicData with types from discovered endpoints
+  # Create both request and response topics/entities upfront to allow discovery before sending
+  request_topic = dynamic_topic(participant, request_endpoint.topic_name, request_endpoint.type)
+  response_topic = dynamic_topic(participant, response_endpoint.topic_name, response_endpoint.type)
+
+  # DDS: Match QoS policies from discovered endpoints
+  # Create writer with same QoS as the target's command_request reader expects
+  writer_qos = dds.DataWriterQos()
+  if request_endpoint.reliability:
+    writer_qos.reliability.kind = request_endpoint.reliability.kind
+  if request_endpoint.durability:
+    writer_qos.durability.kind = request_endpoint.durability.kind
+
+  # DDS: Create publisher with matching partition QoS
+  # Partitions act as logical communication channels - readers and writers
+  # must be in matching partitions to communicate (like network VLANs)
+  publisher = participant.implicit_publisher
+  if request_endpoint.partition:
+    pub_qos = dds.PublisherQos()
+    pub_qos.partition.name = request_endpoint.partition.name
+    publisher = dds.Publisher(participant, pub_qos)
+
+  request_writer = dds.DynamicData.DataWriter(
+      publisher,
+      request_topic,
+      writer_qos
+  )
+
+  # Create reader with same QoS as the target's command_response writer
+  reader_qos = dds.DataReaderQos()
+  if response_endpoint.reliability:
+    reader_qos.reliability.kind = response_endpoint.reliability.kind
+  if response_endpoint.durability:
+    reader_qos.durability.kind = response_endpoint.durability.kind
+
+  # Create subscriber with matching partition if needed
+  subscriber = participant.implicit_subscriber
+  if response_endpoint.partition:
+    sub_qos = dds.SubscriberQos()
+    sub_qos.partition.name = response_endpoint.partition.name
+    subscriber = shared_subscriber(participant, sub_qos)
+
+  response_reader = dds.DynamicData.DataReader(
+      subscriber,
+      response_topic,
+      reader_qos
+  )
+
+  command_channels.append(
+      (participant, request_endpoint.key, response_endpoint.key, request_writer, response_reader))
+  return request_writer, response_reader
+
+
+def host_app_filtered_topic(topic, name, host_id, app_id):
+  """Return a ContentFilteredTopic on topic that selects one RTPS host/app ID pair.
+
+  DDS: The filtered topic is looked up by name and only its parameters are
+  swapped when it already exists, instead of creating one per participant.
+  """
+  filter_parameters = [str(host_id), str(app_id)]
+  filtered_topic = dds.DynamicData.ContentFilteredTopic.find(topic.participant, name)
+  if filtered_topic is None:
+    # Filter expression uses SQL-like syntax with numbered parameters (%0, %1)
+    filter_expression = "hostAndAppId.rtps_host_id = %0 AND hostAndAppId.rtps_app_id = %1"
+    return dds.DynamicData.ContentFilteredTopic(topic, name, dds.Filter(filter_expression, filter_parameters))
+  # Changing the parameters is propagated to matched writers, so only do it
+  # when the dialog targets a different participant than last time
+  if list(filtered_topic.filter_parameters) != filter_parameters:
+    filtered_topic.filter_parameters = filter_parameters
+  return filtered_topic
+
+
+def locator_ip(locator):
+  """Return the dotted IPv4 string held in the last four bytes of a locator address."""
+  return socket.inet_ntoa(bytes(locator.address)[-4:])
+
+
+def sample_source(participant_data):
+  """Return the 'ip:port' source string and domain ID of a writer's participant."""
+  locator = participant_data.default_unicast_locators[0]
+  return f"{locator_ip(locator)}:{locator.port}", participant_data.domain_id
+
+
+def log_received_sample(reader, data_text, source, domain_id):
+  """Log a received DynamicData sample with its source metadata."""
+  # Called per sample; pass arguments so the message is only built when a
+  # handler actually takes the record
+  logging.info("[sample_received] topic='%s' source='%s' domain=%s data=%s",
+               reader.topic_name, source, domain_id, data_text)
 
 
 def take_discovered_sample(reader):
@@ -173,11 +439,7 @@ def take_discovered_sample(reader):
       continue
 
     participant_data = reader.matched_publication_participant_data(sample.info.publication_handle)
-    ip_list = participant_data.default_unicast_locators[0].address[-4:]
-    address_str = '.'.join(str(byte) for byte in ip_list)
-    domain_id = participant_data.domain_id
-    topic_name = reader.topic_name
-    logging.info(f"[sample_received] topic='{topic_name}' source='{address_str}:{participant_data.default_unicast_locators[0].port}' domain={domain_id} data={sample.data}")
+    log_received_sample(reader, sample.data, *sample_source(participant_data))
     return sample.data, sample.info, participant_data
 
   return None, None, None
@@ -189,6 +451,8 @@ class Participant:
     DDS: Each application creates a DomainParticipant which serves as the entry point
     to DDS. The RTPS host_id and app_id uniquely identify participants system-wide.
     """
+    __slots__ = ("name", "ip", "rtps_host_id", "rtps_app_id")
+
     def __init__(self, name=None, ip=None, rtps_host_id=None, rtps_app_id=None):
         self.name = name
         self.ip = ip
@@ -203,9 +467,12 @@ class Endpoint:
   This includes the topic they communicate on, their QoS policies, and which participant owns them.
   QoS policies control reliability, durability, ordering, and other communication behaviors.
   """
+  __slots__ = ("key", "topic_name", "type_name", "type", "kind", "p_ip", "p_name", "p_key",
+               "reliability", "durability", "deadline", "ownership", "presentation", "partition")
+
   def __init__(self, key=None, topic_name=None, type_name=None, type=None, kind=None, p_ip=None, p_name=None, p_key=None, 
                reliability=None, durability=None, deadline=None, ownership=None, presentation=None, partition=None):
-      self.key = key,
+      self.key = key
       self.topic_name = topic_name
       self.type_name = type_name
       self.type = type
@@ -242,6 +509,10 @@ class ParticipantListScreen(Screen):
     self.table = DataTable()
     self.selected_key = None
     self.participant = participant
+    # (RowKey, row values) currently shown in the table, keyed by participant key
+    self.shown_rows = {}
+    # App participants_version the table last reflected
+    self.shown_version = None
 
   def compose(self) -> ComposeResult:
     logging.debug("[ParticipantsScreen.compose] called")
@@ -259,28 +530,44 @@ class ParticipantListScreen(Screen):
     yield Footer()
 
   async def on_mount(self) -> None:
-    await self.refresh_table()
-
-  async def refresh_table(self):
-    self.table.clear()
-    if not self.table.columns:
-      self.table.add_columns("Participant Name", "IP")
-  
-    for idx, (p_key, participant) in enumerate(participants.items()):
-      self.table.add_row(participant.name, participant.ip, key=p_key)
-
+    self.table.add_column("Participant Name", key="name")
+    # Dotted-quad IPs never exceed 15 characters, so fix the width rather
+    # than having the table re-measure every cell in the column
+    self.table.add_column("IP", width=15, key="ip")
     self.table.cursor_type = "row"
     self.table.focus()
-    # Restore selection
-    if self.selected_key is not None:
-      for idx, row in enumerate(self.table.rows):
-        if row == self.selected_key:
-          self.table.move_cursor(row=idx)
-          break
-    self.table.refresh()
+    self.refresh_table()
+
+  def on_screen_resume(self) -> None:
+    # Catch up on changes made while another screen was on top
+    self.refresh_table()
+
+  def refresh_table(self):
+    # Nothing to do unless the participant list changed since the last refresh
+    version = self.app_ref.participants_version
+    if version == self.shown_version:
+      return
+    self.shown_version = version
+
+    # Apply only what changed since the last refresh so the table (and its
+    # cursor) is not rebuilt on every interval tick
+    for p_key in self.shown_rows.keys() - participants.keys():
+      row_key, _ = self.shown_rows.pop(p_key)
+      self.table.remove_row(row_key)
+
+    for p_key, participant in participants.items():
+      row = (participant.name, participant.ip)
+      shown = self.shown_rows.get(p_key)
+      if shown is None:
+        self.shown_rows[p_key] = (self.table.add_row(*row, key=p_key), row)
+      elif shown[1] != row:
+        row_key = shown[0]
+        self.table.update_cell(row_key, "name", participant.name)
+        self.table.update_cell(row_key, "ip", participant.ip)
+        self.shown_rows[p_key] = (row_key, row)
 
   async def on_data_table_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
-    self.selected_key = event.row_key
+    self.selected_key = event.row_key.value
 
   async def on_key(self, event: events.Key) -> None:
     if event.key == "enter" and self.selected_key is not None:
@@ -290,6 +577,21 @@ class ParticipantListScreen(Screen):
       if participant:
         await self.app_ref.push_screen(DistributedLoggerDialog(self.participant, participant, self.selected_key))
 
+def distlog_formatter(member_names):
+  """Return a function rendering a distlog sample as 'name: value | ...' (without hostAndAppId).
+
+  The template and member getter are fixed per type, so per sample only the
+  member lookups and a single str.format remain.
+  """
+  names = [name for name in member_names if name != 'hostAndAppId']
+  template = " | ".join(f"{name}: {{}}" for name in names)
+  if len(names) < 2:
+    # itemgetter needs a name and returns a bare value for just one
+    return lambda data: template.format(*(data[name] for name in names))
+  get_members = operator.itemgetter(*names)
+  return lambda data: template.format(*get_members(data))
+
+
 class DistributedLoggerDialog(ModalScreen):
   """Modal dialog for viewing distributed logger messages, state, and changing filter level"""
   
@@ -355,7 +657,7 @@ class DistributedLoggerDialog(ModalScreen):
   }
   """
   
-  FILTER_LEVEL_OPTIONS = [
+  FILTER_LEVEL_OPTIONS = (
       ("SILENT (0)", 0),
       ("FATAL (100)", 100),
       ("SEVERE (200)", 200),
@@ -365,7 +667,23 @@ class DistributedLoggerDialog(ModalScreen):
       ("INFO (600)", 600),
       ("DEBUG (700)", 700),
       ("TRACE (800)", 800),
-  ]
+  )
+
+  VERBOSITY_NAMES = {
+      0: "SILENT", 100: "FATAL", 200: "SEVERE", 300: "ERROR",
+      400: "WARNING", 500: "NOTICE", 600: "INFO", 700: "DEBUG", 800: "TRACE"
+  }
+  
+  # Most log lines rendered from one take(); under a burst only the newest
+  # are formatted, the rest are dropped
+  MAX_BATCH_LOG_LINES = 100
+
+  # Lines kept in the log panel; older ones are discarded as new ones arrive
+  MAX_LOG_LINES = 5000
+
+  # State members that are not shown in the state panel
+  HIDDEN_STATE_MEMBERS = frozenset(
+      ('hostAndAppId', 'administrationDomainId', 'state', 'rtiLoggerPrintFormat', 'applicationKind'))
   
   def __init__(self, local_participant, target_participant, participant_key):
     super().__init__()
@@ -374,17 +692,30 @@ class DistributedLoggerDialog(ModalScreen):
     self.participant_key = participant_key
     self.distlog_reader = None
     self.state_reader = None
-    self.distlog_subscriber = None
-    self.state_subscriber = None
     self.logger_output = None
     self.state_output = None
     self.debug_output = None
     self.filter_level_select = None
     self.current_filter_level = 600
-    self.distlog_read_task = None
-    self.distlog_topic = None
-    self.state_topic = None
-    self.debug_messages = []
+    # DDS: One WaitSet services both the log and state readers; see dispatch_readers
+    self.waitset = dds.WaitSet()
+    # Triggered by stop_dispatch to wake the wait in dispatch_readers
+    self.dispatch_stop = dds.GuardCondition()
+    self.dispatch_task = None
+    # Monitor and command tasks still running; cancelled on unmount
+    self.tasks = set()
+    # Log-line formatter built from the distlog type's members on first use
+    self.format_distlog = None
+    # Shown state member names, read from the state type on first use
+    self.state_member_names = None
+    self.has_host_app_id = False
+    # Keep only the last 10 debug messages
+    self.debug_messages = collections.deque(maxlen=10)
+    # True while a debug panel update is already scheduled
+    self.debug_update_pending = False
+    # Command request sample and the (type, host ID, app ID) it addresses
+    self.command_request = None
+    self.command_request_target = None
     self.initialized = False
   
   def compose(self) -> ComposeResult:
@@ -393,7 +724,8 @@ class DistributedLoggerDialog(ModalScreen):
       
       yield Static("Log Messages:", classes="section_label")
       with VerticalScroll(id="logger_messages"):
-        self.logger_output = RichLog(highlight=True, markup=True)
+        # Distlog text is shown verbatim: no markup parsing or highlighting per line
+        self.logger_output = RichLog(highlight=False, markup=False, max_lines=self.MAX_LOG_LINES)
         yield self.logger_output
       
       yield Static("State:", classes="section_label")
@@ -420,26 +752,37 @@ class DistributedLoggerDialog(ModalScreen):
     yield Footer()
   
   async def on_mount(self) -> None:
-    asyncio.create_task(self.monitor_distlog())
-    asyncio.create_task(self.monitor_state())
+    self.start_task(self.monitor_distlog())
+    self.start_task(self.monitor_state())
     # Set initialized flag after tasks are started
     self.initialized = True
   
   async def on_unmount(self) -> None:
-    if self.distlog_read_task:
-      self.distlog_read_task.cancel()
-      try:
-        await self.distlog_read_task
-      except asyncio.CancelledError:
-        pass
-    if self.distlog_reader:
+    await self.stop_dispatch()
+    if self.distlog_reader and not self.distlog_reader.closed:
       self.distlog_reader.close()
-    if self.state_reader:
+    if self.state_reader and not self.state_reader.closed:
       self.state_reader.close()
-    if self.distlog_subscriber:
-      self.distlog_subscriber.close()
-    if self.state_subscriber:
-      self.state_subscriber.close()
+
+  def start_task(self, coro):
+    """Run coro as a task that on_unmount cancels if it is still running."""
+    task = asyncio.create_task(coro)
+    self.tasks.add(task)
+    task.add_done_callback(self.tasks.discard)
+    return task
+
+  async def stop_dispatch(self):
+    """Stop the dialog's tasks and the WaitSet service so its readers can be closed."""
+    for task in list(self.tasks):
+      task.cancel()
+    await asyncio.gather(*self.tasks, return_exceptions=True)
+    if self.dispatch_task:
+      # DDS: Cancelling the task would leave its executor thread blocked in the
+      # native wait; the GuardCondition wakes it so the loop can return
+      self.dispatch_stop.trigger_value = True
+      await asyncio.gather(self.dispatch_task, return_exceptions=True)
+      self.dispatch_task = None
+    self.waitset.detach_all()
   
   def on_button_pressed(self, event: Button.Pressed) -> None:
     if event.button.id == "close":
@@ -447,223 +790,150 @@ class DistributedLoggerDialog(ModalScreen):
   
   def log_debug(self, debug_msg):
     """Log a debug message to the debug panel"""
-    import datetime
     timestamp = datetime.datetime.now().strftime("%H:%M:%S")
     debug_line = f"[{timestamp}] {debug_msg}"
     self.debug_messages.append(debug_line)
     
-    # Keep only last 10 debug messages
-    if len(self.debug_messages) > 10:
-      self.debug_messages.pop(0)
-    
+    # Messages logged before the next refresh share one panel update
+    if self.debug_output and not self.debug_update_pending:
+      self.debug_update_pending = True
+      self.call_after_refresh(self.update_debug_output)
+
+  def update_debug_output(self):
     # Update display in reverse order (most recent first)
-    if self.debug_output:
-      display_text = "\n".join(reversed(self.debug_messages[-10:]))
-      self.debug_output.update(display_text)
+    self.debug_update_pending = False
+    display_text = "\n".join(reversed(self.debug_messages))
+    self.debug_output.update(display_text)
   
   def on_select_changed(self, event: Select.Changed) -> None:
     if event.select.id == "select_filter_level" and self.initialized:
       new_level = event.value
       # Only send if value actually changed from current level
       if new_level != self.current_filter_level:
-        # Ensure we have valid host/app IDs before sending command
-        if self.target_participant.rtps_host_id == 0 and self.target_participant.rtps_app_id == 0:
-          self.log_debug("Cannot send command: host/app ID not yet available. Please wait for state to load.")
-        else:
-          asyncio.create_task(self.send_filter_level_command(new_level))
+        # send_filter_level_command checks for valid host/app IDs itself
+        self.start_task(self.send_filter_level_command(new_level))
   
   async def monitor_distlog(self):
     """Monitor distributed logger messages"""
     try:
-      # DDS: Find the endpoint discovered via builtin topics
-      # This gives us the writer's QoS so we can match it with our reader
-      distlog_endpoint = None
-      for endpoint_key, endpoint in endpoints.items():
-        if endpoint.p_key == self.participant_key and endpoint.topic_name == "rti/distlog":
-          distlog_endpoint = endpoint
-          break
-      
-      if not distlog_endpoint or not distlog_endpoint.type:
-        error_msg = "rti/distlog topic not found or no type information available."
-        self.log_debug(error_msg)
+      self.distlog_reader = self.create_filtered_reader("rti/distlog", "monitor_distlog")
+      if self.distlog_reader is None:
         return
-      
-      if self.distlog_topic is None:
-        try:
-          # DDS: Try to find existing topic first (best practice)
-          self.distlog_topic = self.local_participant.find_topic("rti/distlog")
-          self.log_debug("Found existing distlog topic")
-        except Exception as e:
-          try:
-            # DDS: Create topic using DynamicData with type discovered from builtin topics
-            # This allows subscribing to topics without compile-time generated code
-            self.distlog_topic = dds.DynamicData.Topic(self.local_participant, "rti/distlog", distlog_endpoint.type)
-            self.log_debug("Created new distlog topic")
-          except Exception as topic_error:
-            error_msg = f"Failed to create distlog topic: {topic_error}"
-            self.log_debug(error_msg)
-            logging.error(f"[monitor_distlog] {error_msg}")
-            return
-      
-      # DDS: Create ContentFilteredTopic to receive only messages from target participant
-      # Filtering happens at the source, reducing network traffic and CPU overhead
-      # Filter expression uses SQL-like syntax with numbered parameters (%0, %1)
-      filter_expression = "hostAndAppId.rtps_host_id = %0 AND hostAndAppId.rtps_app_id = %1"
-      filter_parameters = [str(self.target_participant.rtps_host_id), str(self.target_participant.rtps_app_id)]
-      
-      filtered_topic_name = f"rti/distlog_filtered_{self.target_participant.rtps_host_id}_{self.target_participant.rtps_app_id}"
-      content_filtered_topic = dds.DynamicData.ContentFilteredTopic(
-          self.distlog_topic,
-          filtered_topic_name,
-          dds.Filter(filter_expression, filter_parameters)
-      )
-      
-      # DDS: Match subscriber partition QoS with discovered writer's partition
-      # Readers and writers must be in matching partitions to communicate
-      subscriber_qos = dds.SubscriberQos()
-      if distlog_endpoint.partition:
-        subscriber_qos.partition.name = distlog_endpoint.partition.name
-      
-      self.distlog_subscriber = dds.Subscriber(self.local_participant, subscriber_qos if distlog_endpoint.partition else None)
-      
-      # DDS: Configure reader QoS to match or be compatible with writer's QoS
-      # The reader drives QoS matching - as long as reader requests "lower" QoS than writer provides, they match
-      # Reliability: Reader can request BEST_EFFORT even if writer offers RELIABLE (but not vice versa)
-      # Durability: Reader must request <= writer's durability to match (VOLATILE <= TRANSIENT_LOCAL <= PERSISTENT)
-      #             For distlog, we match the writer's durability to receive late-joiner historical samples
-      # Note: Full QoS matching shown here for reference - not all policies may be strictly necessary for this scenario
-      reader_qos = dds.DataReaderQos()
-      if distlog_endpoint.reliability:
-        reader_qos.reliability.kind = distlog_endpoint.reliability.kind
-      if distlog_endpoint.durability:
-        reader_qos.durability.kind = distlog_endpoint.durability.kind
-      
-      self.distlog_reader = dds.DynamicData.DataReader(self.distlog_subscriber, content_filtered_topic, reader_qos)
       self.logger_output.write("Monitoring distributed logger messages...")
       
-      self.distlog_read_task = asyncio.create_task(self.read_distlog_samples())
+      self.attach_reader(self.distlog_reader, self.read_distlog_samples)
       
     except Exception as e:
       error_msg = f"Error subscribing to distributed logger: {e}"
       self.log_debug(error_msg)
       logging.error(f"[monitor_distlog] {e}")
   
-  async def read_distlog_samples(self):
-    """Read distributed logger samples"""
-    try:
-      while self.distlog_reader is not None:
-        # DDS: take() removes samples from reader cache (vs read() which leaves them)
-        # Returns list of SampleInfo + data tuples
-        samples = self.distlog_reader.take()
-        for sample in samples:
-          # DDS: Check if sample is valid data (not metadata like dispose/unregister)
-          if sample.info.valid:
-            try:
-              member_names = list(sample.data.fields())
-              log_line = " | ".join([f"{name}: {sample.data[name]}" for name in member_names if name != 'hostAndAppId'])
-              self.logger_output.write(log_line)
-            except Exception as e:
-              error_msg = f"Error processing sample: {e}"
-              logging.error(f"[read_distlog_samples] {error_msg}")
-              self.log_debug(error_msg)
-        
-        await asyncio.sleep(0.1)
-    except Exception as e:
-      error_msg = f"Error reading distlog samples: {e}"
-      logging.error(f"[read_distlog_samples] {error_msg}")
+  def create_filtered_reader(self, topic_name, source, status_output=None):
+    """Create a reader for topic_name that only receives the target participant's samples.
+
+    Problems are reported to the debug panel (and status_output, if given)
+    and None is returned; source is the log prefix.
+    """
+    def report(error_msg):
+      if status_output is not None:
+        status_output.update(error_msg)
       self.log_debug(error_msg)
+
+    # DDS: Find the endpoint discovered via builtin topics
+    # This gives us the writer's QoS so we can match it with our reader
+    endpoint = participant_topic_endpoint(self.participant_key, topic_name)
+    if not endpoint or not endpoint.type:
+      report(f"{topic_name} topic not found or no type information available.")
+      return None
+
+    try:
+      # DDS: Reuse the topic (and its registered type) from an earlier dialog;
+      # otherwise create it with the type discovered from builtin topics,
+      # which allows subscribing without compile-time generated code
+      topic = dynamic_topic(self.local_participant, topic_name, endpoint.type)
+    except Exception as topic_error:
+      error_msg = f"Failed to create {topic_name} topic: {topic_error}"
+      report(error_msg)
+      logging.error(f"[{source}] {error_msg}")
+      return None
+
+    # DDS: Create ContentFilteredTopic to receive only samples from target participant
+    # Filtering happens at the source, reducing network traffic and CPU overhead
+    content_filtered_topic = host_app_filtered_topic(
+        topic,
+        f"{topic_name}_filtered",
+        self.target_participant.rtps_host_id,
+        self.target_participant.rtps_app_id
+    )
+
+    # DDS: Create subscriber (partition/presentation) and reader QoS compatible with the writer
+    # Durability: matching the writer's durability receives late-joiner historical samples
+    # Deadline: Reader deadline must be >= writer deadline (less strict)
+    # Ownership: Must match exactly (SHARED vs EXCLUSIVE)
+    subscriber_qos, reader_qos = matching_reader_qos(endpoint)
+    subscriber = shared_subscriber(self.local_participant, subscriber_qos)
+    return dds.DynamicData.DataReader(subscriber, content_filtered_topic, reader_qos)
+  
+  def attach_reader(self, reader, handler):
+    """Call handler(condition) on the UI loop whenever reader has data"""
+    # DDS: A ReadCondition with a handler; dispatch_readers runs it when it triggers
+    self.waitset += dds.ReadCondition(reader, dds.DataState.any, handler)
+    if self.dispatch_task is None:
+      self.waitset += self.dispatch_stop
+      self.dispatch_task = asyncio.create_task(self.dispatch_readers())
+  
+  async def dispatch_readers(self):
+    """Wait for any attached reader to have data and run its handler"""
+    while not self.dispatch_stop.trigger_value:
+      # DDS: The wait wakes this task only when samples arrive, instead of
+      # polling the readers on a timer
+      for condition in await self.waitset.wait_async():
+        # A failing handler is reported and the other reader keeps updating
+        try:
+          condition.dispatch()
+        except Exception as e:
+          error_msg = f"Error reading distlog samples: {e}"
+          logging.error(f"[dispatch_readers] {error_msg}")
+          self.log_debug(error_msg)
+  
+  def read_distlog_samples(self, condition=None):
+    """Read distributed logger samples"""
+    # DDS: take() removes samples from reader cache (vs read() which leaves them)
+    # take_data() returns only valid data, skipping metadata like dispose/unregister
+    samples = self.distlog_reader.take_data()
+    dropped = len(samples) - self.MAX_BATCH_LOG_LINES
+    log_lines = []
+    if dropped > 0:
+      samples = samples[dropped:]
+      log_lines.append(f"... {dropped} older messages dropped ...")
+    for data in samples:
+      try:
+        # Member names belong to the type, not the sample; build the formatter once
+        if self.format_distlog is None:
+          self.format_distlog = distlog_formatter(data.fields())
+        log_lines.append(self.format_distlog(data))
+      except Exception as e:
+        error_msg = f"Error processing sample: {e}"
+        logging.error(f"[read_distlog_samples] {error_msg}")
+        self.log_debug(error_msg)
+    
+    # One widget update per take() rather than one per sample
+    if log_lines:
+      self.logger_output.write("\n".join(log_lines))
   
   async def monitor_state(self):
     """Monitor distributed logger state"""
     try:
-      state_endpoint = None
-      for endpoint_key, endpoint in endpoints.items():
-        if endpoint.p_key == self.participant_key and endpoint.topic_name == "rti/distlog/administration/state":
-          state_endpoint = endpoint
-          break
-      
-      if not state_endpoint or not state_endpoint.type:
-        error_msg = "rti/distlog/administration/state topic not found or no type information available."
-        self.state_output.update(error_msg)
-        self.log_debug(error_msg)
+      self.state_reader = self.create_filtered_reader(
+          "rti/distlog/administration/state", "monitor_state", self.state_output)
+      if self.state_reader is None:
         return
       
-      if self.state_topic is None:
-        try:
-          self.state_topic = self.local_participant.find_topic("rti/distlog/administration/state")
-          self.log_debug("Found existing state topic")
-        except Exception as e:
-          try:
-            self.state_topic = dds.DynamicData.Topic(self.local_participant, "rti/distlog/administration/state", state_endpoint.type)
-            self.log_debug("Created new state topic")
-          except Exception as topic_error:
-            error_msg = f"Failed to create state topic: {topic_error}"
-            self.state_output.update(error_msg)
-            self.log_debug(error_msg)
-            logging.error(f"[monitor_state] {error_msg}")
-            return
-      
-      filter_expression = "hostAndAppId.rtps_host_id = %0 AND hostAndAppId.rtps_app_id = %1"
-      filter_parameters = [str(self.target_participant.rtps_host_id), str(self.target_participant.rtps_app_id)]
-      
-      filtered_topic_name = f"rti/distlog/administration/state_filtered_{self.target_participant.rtps_host_id}_{self.target_participant.rtps_app_id}"
-      content_filtered_topic = dds.DynamicData.ContentFilteredTopic(
-          self.state_topic,
-          filtered_topic_name,
-          dds.Filter(filter_expression, filter_parameters)
-      )
-      
-      # DDS: Create subscriber with partition and presentation QoS if needed
-      # Presentation QoS controls ordering and coherency of samples
-      subscriber_qos = dds.SubscriberQos()
-      qos_set = False
-      
-      if state_endpoint.partition:
-        subscriber_qos.partition.name = state_endpoint.partition.name
-        qos_set = True
-      
-      if state_endpoint.presentation:
-        # Match presentation access_scope, coherent_access, and ordered_access
-        subscriber_qos.presentation.access_scope = state_endpoint.presentation.access_scope
-        subscriber_qos.presentation.coherent_access = state_endpoint.presentation.coherent_access
-        subscriber_qos.presentation.ordered_access = state_endpoint.presentation.ordered_access
-        qos_set = True
-      
-      if qos_set:
-        self.state_subscriber = dds.Subscriber(self.local_participant, subscriber_qos)
-      else:
-        self.state_subscriber = dds.Subscriber(self.local_participant)
-      
-      # DDS: Configure reader QoS for compatibility with writer
-      # Reader drives matching - request equal or "lower" QoS than writer offers
-      # Durability: Match writer's TRANSIENT_LOCAL to receive historical state as late joiner
-      # Deadline: Reader deadline must be >= writer deadline (less strict)
-      # Ownership: Must match exactly (SHARED vs EXCLUSIVE)
-      # Note: Full QoS matching shown here for reference - not all policies may be strictly necessary for this scenario
-      reader_qos = dds.DataReaderQos()
-      if state_endpoint.reliability:
-        reader_qos.reliability.kind = state_endpoint.reliability.kind
-        if state_endpoint.reliability.max_blocking_time:
-          reader_qos.reliability.max_blocking_time = state_endpoint.reliability.max_blocking_time
-      if state_endpoint.durability:
-        reader_qos.durability.kind = state_endpoint.durability.kind
-      if state_endpoint.deadline:
-        reader_qos.deadline.period = state_endpoint.deadline.period
-      if state_endpoint.ownership:
-        reader_qos.ownership.kind = state_endpoint.ownership.kind
-      
-      self.state_reader = dds.DynamicData.DataReader(self.state_subscriber, content_filtered_topic, reader_qos)
-      
       self.state_output.update("Subscribed to state topic. Waiting for state updates...")
       
-      # DDS: Wait for TRANSIENT_LOCAL durability samples to arrive
-      # Durability allows late-joining readers to receive historical samples
-      # Multiple refresh attempts ensure we catch these samples
-      await asyncio.sleep(0.5)
-      max_attempts = 4
-      for attempt in range(max_attempts):
-        self.refresh_state_display()
-        await asyncio.sleep(0.5)
+      # DDS: TRANSIENT_LOCAL samples for late joiners and later state changes
+      # both trigger the reader's ReadCondition
+      self.attach_reader(self.state_reader, self.refresh_state_display)
       
     except Exception as e:
       error_msg = f"Error subscribing to state topic: {e}"
@@ -671,86 +941,85 @@ class DistributedLoggerDialog(ModalScreen):
       self.log_debug(error_msg)
       logging.error(f"[monitor_state] {e}")
   
-  def refresh_state_display(self):
+  def refresh_state_display(self, condition=None):
     """Refresh state display"""
     if self.state_reader is None:
       return
     
     try:
-      samples = self.state_reader.take()
-      for sample in samples:
-        if sample.info.valid:
-          try:
-            member_names = list(sample.data.fields())
-            lines = []
-            
-            # Extract hostAndAppId from the state for commanding
-            if 'hostAndAppId' in member_names:
-              host_app_id = sample.data['hostAndAppId']
-              actual_host_id = host_app_id['rtps_host_id']
-              actual_app_id = host_app_id['rtps_app_id']
-              # Update target participant with correct values from state
-              self.target_participant.rtps_host_id = actual_host_id
-              self.target_participant.rtps_app_id = actual_app_id
-              self.log_debug(f"Updated target host/app ID from state: {actual_host_id}/{actual_app_id}")
-            
-            for name in member_names:
-              if name in ['hostAndAppId', 'administrationDomainId', 'state', 'rtiLoggerPrintFormat', 'applicationKind']:
-                continue
-              
-              if name == 'filterLevel':
-                level_value = sample.data[name]
-                self.current_filter_level = level_value
-                if self.filter_level_select:
-                  # Temporarily disable to prevent triggering command on programmatic update
-                  old_initialized = self.initialized
-                  self.initialized = False
-                  self.filter_level_select.value = level_value
-                  self.initialized = old_initialized
-                level_name = self.convert_verbosity_level(level_value)
-                lines.append(f"{name}: {level_name} ({level_value})")
-              elif name == 'rtiLoggerVerbosities':
-                verbosities = sample.data[name]
-                lines.append(f"{name}:")
-                for item in verbosities:
-                  lines.append(f"  {item['category']}: {item['verbosity']}")
-              else:
-                lines.append(f"{name}: {sample.data[name]}")
-            
-            state_text = "\n".join(lines)
-            self.state_output.update(state_text)
-          except Exception as e:
-            logging.error(f"[refresh_state_display] Error processing sample: {e}")
+      # take_data() returns only valid data, skipping dispose/unregister metadata.
+      # Each sample is a complete snapshot of the logger state, so when
+      # several are queued only the newest is worth rendering
+      for data in self.state_reader.take_data()[-1:]:
+        try:
+          # Member names belong to the type, not the sample; list them once
+          if self.state_member_names is None:
+            member_names = list(data.fields())
+            self.has_host_app_id = 'hostAndAppId' in member_names
+            self.state_member_names = [
+                name for name in member_names if name not in self.HIDDEN_STATE_MEMBERS]
+          lines = []
+          
+          # Extract hostAndAppId from the state for commanding
+          if self.has_host_app_id:
+            host_app_id = data['hostAndAppId']
+            actual_host_id = host_app_id['rtps_host_id']
+            actual_app_id = host_app_id['rtps_app_id']
+            # Update target participant with correct values from state
+            self.target_participant.rtps_host_id = actual_host_id
+            self.target_participant.rtps_app_id = actual_app_id
+            self.log_debug(f"Updated target host/app ID from state: {actual_host_id}/{actual_app_id}")
+          
+          for name in self.state_member_names:
+            if name == 'filterLevel':
+              level_value = data[name]
+              self.current_filter_level = level_value
+              if self.filter_level_select:
+                # Temporarily disable to prevent triggering command on programmatic update
+                old_initialized = self.initialized
+                self.initialized = False
+                self.filter_level_select.value = level_value
+                self.initialized = old_initialized
+              level_name = self.convert_verbosity_level(level_value)
+              lines.append(f"{name}: {level_name} ({level_value})")
+            elif name == 'rtiLoggerVerbosities':
+              verbosities = data[name]
+              lines.append(f"{name}:")
+              for item in verbosities:
+                lines.append(f"  {item['category']}: {item['verbosity']}")
+            else:
+              lines.append(f"{name}: {data[name]}")
+          
+          state_text = "\n".join(lines)
+          self.state_output.update(state_text)
+        except Exception as e:
+          logging.error(f"[refresh_state_display] Error processing sample: {e}")
     except Exception as e:
       logging.error(f"[refresh_state_display] {e}")
   
   def convert_verbosity_level(self, level):
     """Convert numeric verbosity level to string name"""
-    verbosity_map = {
-      0: "SILENT", 100: "FATAL", 200: "SEVERE", 300: "ERROR",
-      400: "WARNING", 500: "NOTICE", 600: "INFO", 700: "DEBUG", 800: "TRACE"
-    }
-    return verbosity_map.get(level, f"UNKNOWN({level})")
+    return self.VERBOSITY_NAMES.get(level, f"UNKNOWN({level})")
   
   async def send_filter_level_command(self, filter_level):
     """Send filter level change command using DynamicData types discovered from builtin topics"""
+    # Nothing can be addressed until the state sample has supplied the IDs
+    if self.target_participant.rtps_host_id == 0 and self.target_participant.rtps_app_id == 0:
+      self.log_debug("Cannot send command: host/app ID not yet available. Please wait for state to load.")
+      return
+
     try:
       self.log_debug(f"Target participant: host_id={self.target_participant.rtps_host_id}, app_id={self.target_participant.rtps_app_id}")
       
       # DDS: Find command request/response topics from discovered endpoints for target participant
       # Focus on the target participant to ensure we're using the correct types/QoS
-      request_endpoint = None
-      response_endpoint = None
-      
-      for endpoint_key, endpoint in endpoints.items():
-        if endpoint.p_key == self.participant_key:
-          if endpoint.topic_name == "rti/distlog/administration/command_request":
-            request_endpoint = endpoint
-          elif endpoint.topic_name == "rti/distlog/administration/command_response":
-            response_endpoint = endpoint
+      request_endpoint = participant_topic_endpoint(
+          self.participant_key, "rti/distlog/administration/command_request")
+      response_endpoint = participant_topic_endpoint(
+          self.participant_key, "rti/distlog/administration/command_response")
       
       if not request_endpoint or not request_endpoint.type:
-        error_msg = f"Command request topic not found for target participant. Available: {[(e.topic_name, e.kind) for k,e in endpoints.items() if e.p_key == self.participant_key]}"
+        error_msg = f"Command request topic not found for target participant. Available: {[(e.topic_name, e.kind) for e in participant_endpoints(self.participant_key)]}"
         self.log_debug(error_msg)
         return
       
@@ -759,88 +1028,15 @@ class DistributedLoggerDialog(ModalScreen):
         self.log_debug(error_msg)
         return
       
-      # DDS: Create CommandRequest using DynamicData
-      # Get the type from the discovered endpoint
-      request_type = request_endpoint.type
-      command_request = dds.DynamicData(request_type)
-      
       # Prepare values for command request
       target_host = self.target_participant.rtps_host_id
       target_app = self.target_participant.rtps_app_id
-      self.log_debug(f"About to set: target_host={target_host}, target_app={target_app}")
-      
-      # DDS: Set nested struct fields using dot notation in bracket syntax
-      # Format: data["struct_name.field_name"] for accessing nested members
-      command_request["targetHostAndAppId.rtps_host_id"] = target_host
-      command_request["targetHostAndAppId.rtps_app_id"] = target_app
-      
-      command_request["originatorHostAndAppId.rtps_host_id"] = 0
-      command_request["originatorHostAndAppId.rtps_app_id"] = 0
-      
-      # Set invocation timestamp for response correlation
-      invocation_timestamp = int(time.time())
-      command_request["invocation"] = invocation_timestamp
-      
-      # DDS: Set union member - discriminator is automatically set when member is assigned
-      # For unions in DynamicData, setting the member value implicitly sets the discriminator
-      command_request["command.filterLevel"] = filter_level
-      
-      # DDS: Create topics using DynamicData with types from discovered endpoints
-      # Create both request and response topics/entities upfront to allow discovery before sending
-      request_topic = dds.DynamicData.Topic(
-          self.local_participant,
-          request_endpoint.topic_name,
-          request_endpoint.type
-      )
-      
-      response_topic = dds.DynamicData.Topic(
-          self.local_participant,
-          response_endpoint.topic_name,
-          response_endpoint.type
-      )
-      
-      # DDS: Match QoS policies from discovered endpoints
-      # Create writer with same QoS as the target's command_request reader expects
-      writer_qos = dds.DataWriterQos()
-      if request_endpoint.reliability:
-        writer_qos.reliability.kind = request_endpoint.reliability.kind
-      if request_endpoint.durability:
-        writer_qos.durability.kind = request_endpoint.durability.kind
-      
-      # DDS: Create publisher with matching partition QoS
-      # Partitions act as logical communication channels - readers and writers
-      # must be in matching partitions to communicate (like network VLANs)
-      publisher = self.local_participant.implicit_publisher
-      if request_endpoint.partition:
-        pub_qos = dds.PublisherQos()
-        pub_qos.partition.name = request_endpoint.partition.name
-        publisher = dds.Publisher(self.local_participant, pub_qos)
-      
-      request_writer = dds.DynamicData.DataWriter(
-          publisher,
-          request_topic,
-          writer_qos
-      )
-      
-      # Create reader with same QoS as the target's command_response writer
-      reader_qos = dds.DataReaderQos()
-      if response_endpoint.reliability:
-        reader_qos.reliability.kind = response_endpoint.reliability.kind
-      if response_endpoint.durability:
-        reader_qos.durability.kind = response_endpoint.durability.kind
+      command_request = self.addressed_command_request(request_endpoint.type, target_host, target_app)
       
-      # Create subscriber with matching partition if needed
-      subscriber = self.local_participant.implicit_subscriber
-      if response_endpoint.partition:
-        sub_qos = dds.SubscriberQos()
-        sub_qos.partition.name = response_endpoint.partition.name
-        subscriber = dds.Subscriber(self.local_participant, sub_qos)
-      
-      response_reader = dds.DynamicData.DataReader(
-          subscriber,
-          response_topic,
-          reader_qos
-      )
+      # DDS: Writer/reader matching the target's command endpoints; both are
+      # created once and reused, so later commands find them already matched
+      request_writer, response_reader = command_channel(
+          self.local_participant, request_endpoint, response_endpoint)
       
       # DDS: Wait for discovery to complete before sending command
       # Discovery is asynchronous - writers/readers must match before data exchange
@@ -848,11 +1044,7 @@ class DistributedLoggerDialog(ModalScreen):
       # subscription_matched_status: tracks how many writers discovered this reader
       # Creating both entities upfront ensures response reader is ready when reply arrives
       self.log_debug("Waiting for discovery...")
-      discovery_timeout = 0
-      while (request_writer.publication_matched_status.current_count == 0 or 
-             response_reader.subscription_matched_status.current_count == 0) and discovery_timeout < 50:
-        await asyncio.sleep(0.1)
-        discovery_timeout += 1
+      await self.wait_for_command_match(request_writer, response_reader, timeout=5)
       
       if request_writer.publication_matched_status.current_count == 0:
         error_msg = "No command subscriber found."
@@ -866,56 +1058,125 @@ class DistributedLoggerDialog(ModalScreen):
       
       self.log_debug(f"Discovery complete: request matched={request_writer.publication_matched_status.current_count}, response matched={response_reader.subscription_matched_status.current_count}")
       
+      # The request sample is shared, so fill it in only after the last await
+      # Set a unique invocation ID for response correlation
+      invocation = next(command_invocations)
+      command_request["invocation"] = invocation
+      
+      # DDS: Set union member - discriminator is automatically set when member is assigned
+      # For unions in DynamicData, setting the member value implicitly sets the discriminator
+      command_request["command.filterLevel"] = filter_level
+      
       # DDS: Send command request using write()
       request_writer.write(command_request)
       self.log_debug(f"Sent filter level command: {filter_level}")
       
-      # DDS: Poll for response using async pattern
-      # datareader_cache_status.sample_count: number of samples available to read
-      # In async contexts, polling is preferable to blocking WaitSet.wait()
-      # take() retrieves and removes samples from reader's cache
-      poll_count = 0
-      max_polls = 300  # 30 seconds timeout
-      
-      while poll_count < max_polls:
-        if response_reader.datareader_cache_status.sample_count > 0:
-          responses = response_reader.take()
-          for sample in responses:
-            # DDS: Validate sample using SampleInfo
-            if sample.info.valid:
-              response_data = sample.data
-              
-              # DDS: Correlate response to request using invocation timestamp
-              # In request-reply patterns, correlation ensures we match responses to requests
-              # Check originator ID (0/0 = our request) and invocation timestamp
-              originator = response_data["originatorHostAndAppId"]
-              if (originator["rtps_host_id"] == 0 and 
-                  originator["rtps_app_id"] == 0 and
-                  response_data["invocation"] == invocation_timestamp):
-                
-                # Extract result and optional message
-                command_result = response_data["commandResult"]
-                try:
-                  message = response_data["message"]
-                except KeyError:
-                  message = ""
-                
-                self.log_debug(f"Command reply: result={command_result}, message={message}")
-                
-                # CommandResult OK = 0 indicates success
-                if command_result == 0:
-                  self.refresh_state_display()
-                return
-        
-        await asyncio.sleep(0.1)
-        poll_count += 1
-      
-      self.log_debug("Command sent, but no response received (timeout).")
+      # DDS: Wait for the correlated response; the reply QueryCondition
+      # wakes only when a matching sample arrives, without polling the reader cache
+      response_data = await self.wait_for_command_reply(response_reader, invocation, timeout=30)
+      if response_data is None:
+        self.log_debug("Command sent, but no response received (timeout).")
+        return
+
+      # Extract result and optional message
+      command_result = response_data["commandResult"]
+      try:
+        message = response_data["message"]
+      except KeyError:
+        message = ""
+
+      self.log_debug(f"Command reply: result={command_result}, message={message}")
+
+      # CommandResult OK = 0 indicates success
+      if command_result == 0:
+        self.refresh_state_display()
     except Exception as e:
       error_msg = f"Error sending command: {e}"
       self.log_debug(error_msg)
       logging.error(f"[send_filter_level_command] {e}")
 
+  def addressed_command_request(self, request_type, target_host, target_app):
+    """Return a CommandRequest sample addressed to the target, reusing the previous one.
+
+    DDS: write() copies the sample, so the same DynamicData can be sent again
+    with only the invocation and command members changed.
+    """
+    cached = self.command_request_target
+    if cached is not None and cached[0] is request_type and cached[1:] == (target_host, target_app):
+      return self.command_request
+
+    # DDS: Create CommandRequest using DynamicData
+    # Get the type from the discovered endpoint
+    command_request = dds.DynamicData(request_type)
+    self.log_debug(f"About to set: target_host={target_host}, target_app={target_app}")
+
+    # DDS: Set nested struct fields using dot notation in bracket syntax
+    # Format: data["struct_name.field_name"] for accessing nested members
+    command_request["targetHostAndAppId.rtps_host_id"] = target_host
+    command_request["targetHostAndAppId.rtps_app_id"] = target_app
+
+    command_request["originatorHostAndAppId.rtps_host_id"] = 0
+    command_request["originatorHostAndAppId.rtps_app_id"] = 0
+
+    self.command_request = command_request
+    self.command_request_target = (request_type, target_host, target_app)
+    return command_request
+
+  async def wait_for_command_match(self, request_writer, response_reader, timeout):
+    """Return once the command writer and the response reader have both matched,
+    or after timeout seconds."""
+    # DDS: The entities' StatusConditions trigger when their match counts
+    # change, so the wait needs no polling interval
+    waitset = dds.WaitSet()
+    for entity, status in ((request_writer, dds.StatusMask.PUBLICATION_MATCHED),
+                           (response_reader, dds.StatusMask.SUBSCRIPTION_MATCHED)):
+      condition = dds.StatusCondition(entity)
+      condition.enabled_statuses = status
+      waitset += condition
+    # DDS: The timeout is given to the wait itself; cancelling the await from
+    # asyncio would leave its executor thread blocked on this WaitSet
+    deadline = asyncio.get_running_loop().time() + timeout
+    # Reading the statuses also resets their triggers for the next wait
+    while (request_writer.publication_matched_status.current_count == 0 or
+           response_reader.subscription_matched_status.current_count == 0):
+      remaining = deadline - asyncio.get_running_loop().time()
+      if remaining <= 0:
+        return
+      await waitset.wait_async(dds.Duration(remaining))
+
+  async def wait_for_command_reply(self, response_reader, invocation, timeout):
+    """Return the first command response that answers our request, or None
+    after timeout seconds."""
+    # DDS: Correlate response to request using the invocation ID
+    # In request-reply patterns, correlation ensures we match responses to requests
+    # A QueryCondition applies the match in the middleware so only the
+    # answer is taken and handed to Python; originator ID 0/0 marks our requests
+    query = dds.Query(
+        response_reader,
+        "originatorHostAndAppId.rtps_host_id = 0 AND originatorHostAndAppId.rtps_app_id = 0 AND invocation = %0",
+        [str(invocation)])
+    condition = dds.QueryCondition(query, dds.DataState.any_data)
+    # Each command waits on its own WaitSet, so overlapping commands do not
+    # share a condition; the GuardCondition wakes the wait if this task ends early
+    waitset = dds.WaitSet()
+    done = dds.GuardCondition()
+    waitset += condition
+    waitset += done
+    deadline = asyncio.get_running_loop().time() + timeout
+    try:
+      while True:
+        replies = response_reader.select().condition(condition).take_data()
+        if replies:
+          return replies[0]
+        remaining = deadline - asyncio.get_running_loop().time()
+        if remaining <= 0:
+          return None
+        await waitset.wait_async(dds.Duration(remaining))
+    finally:
+      done.trigger_value = True
+      waitset.detach_all()
+      condition.close()
+
 class EndpointListScreen(Screen):
   def __init__(self, app_ref, participant_key, participant):
     super().__init__()
@@ -934,18 +1195,27 @@ class EndpointListScreen(Screen):
     yield Footer()
 
   async def on_mount(self) -> None:
-    self.table.clear()
-    self.table.add_columns("Topic Name", "Kind")
-    for key, entity in endpoints.items():
-      if getattr(entity, 'p_key', None) == self.participant_key:
-        self.table.add_row(entity.topic_name, entity.kind, key=key)
+    # Rows are only ever appended (here and from add_endpoints), so there is
+    # nothing to clear
+    self.table.add_column("Topic Name")
+    # Kind is always "Reader" or "Writer"
+    self.table.add_column("Kind", width=6)
+    self.add_endpoints(participant_endpoints(self.participant_key))
     self.table.cursor_type = "row"
 
+  def add_endpoints(self, new_endpoints):
+    """Append rows for endpoints of this participant that are not shown yet."""
+    # DataTable.add_rows() cannot carry row keys, so add keyed rows here;
+    # the table lays out once on the next refresh either way
+    for entity in new_endpoints:
+      if entity.p_key == self.participant_key:
+        self.table.add_row(entity.topic_name, entity.kind, key=entity.key)
+
   async def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
-    self.selected_key = event.row_key
+    self.selected_key = event.row_key.value
 
   async def on_data_table_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
-    self.selected_key = event.row_key
+    self.selected_key = event.row_key.value
 
   async def on_key(self, event: events.Key) -> None:
     if event.key == "enter" and self.selected_key is not None:
@@ -964,10 +1234,12 @@ class ParticipantDetailScreen(Screen):
     super().__init__()
     self.endpoint = endpoint
     self.participant = participant
-    self.sample_lines = []
+    self.sample_lines = collections.deque(maxlen=20)
+    # True while an output update is already scheduled
+    self.output_update_pending = False
     self.table = DataTable()
     self.dynamic_reader = None
-    self.subscriber = None
+    self._sub_task = None
 
   def compose(self) -> ComposeResult:
     yield Header()
@@ -978,28 +1250,23 @@ class ParticipantDetailScreen(Screen):
     yield Footer()
 
   async def on_mount(self) -> None:
-    if getattr(self.endpoint, 'kind', None) == 'Writer':
+    self.app.detail_screens.add(self)
+    if self.endpoint.kind == 'Writer':
         self._sub_task = asyncio.create_task(self.subscribe_topic())
     else:
         self.output_widget.update("Subscription only available for Writer endpoints.")
 
   async def on_unmount(self) -> None:
-    # Clean up reader and subscriber when screen is unmounted
+    # Clean up the reader when screen is unmounted; its subscriber is shared
+    self.app.detail_screens.discard(self)
+    await self.cancel_subscription()
     if self.dynamic_reader is not None:
       try:
-        logging.info(f"[on_unmount] Closing DataReader for topic: {self.endpoint.topic_name}")
+        logging.info("[on_unmount] Closing DataReader for topic: %s", self.endpoint.topic_name)
         self.dynamic_reader.close()
         self.dynamic_reader = None
       except Exception as e:
         logging.error(f"[on_unmount] Error closing DataReader: {e}")
-    
-    if self.subscriber is not None:
-      try:
-        logging.info(f"[on_unmount] Closing Subscriber")
-        self.subscriber.close()
-        self.subscriber = None
-      except Exception as e:
-        logging.error(f"[on_unmount] Error closing Subscriber: {e}")
 
   async def subscribe_topic(self):
     """Subscribe to discovered topic using DynamicData (no generated code required).
@@ -1009,8 +1276,15 @@ class ParticipantDetailScreen(Screen):
     This enables generic monitoring tools like RTI Spy to work with any DDS type.
     """
     try:
-      subscriber, dynamic_topic, dynamic_reader = create_topic_subscription(self.participant, self.endpoint)
-      self.subscriber = subscriber
+      # Entity creation runs on a worker thread so a slow create does not
+      # stall the UI; shield it so a cancel cannot orphan what it creates
+      creation = asyncio.ensure_future(
+        asyncio.to_thread(create_topic_subscription, self.participant, self.endpoint))
+      try:
+        _, _, dynamic_reader = await asyncio.shield(creation)
+      except asyncio.CancelledError:
+        creation.add_done_callback(close_created_subscription)
+        raise
       self.dynamic_reader = dynamic_reader
 
       qos_info = ""
@@ -1024,24 +1298,112 @@ class ParticipantDetailScreen(Screen):
         qos_info += f"Partitions: {', '.join(self.endpoint.partition.name)}\n"
       self.output_widget.update(f"Subscribed to topic '{self.endpoint.topic_name}'.\n{qos_info}Waiting for samples...\n")
 
-      while True:
-        await asyncio.sleep(0.1)
-        data, info, participant_data = take_discovered_sample(dynamic_reader)
-        if data is not None:
-          ip_list = participant_data.default_unicast_locators[0].address[-4:]
-          address_str = '.'.join(str(byte) for byte in ip_list)
-          domain_id = participant_data.domain_id
-          port = participant_data.default_unicast_locators[0].port
-          topic_name = dynamic_reader.topic_name
-
-          line = f"[{address_str}:{port} D:{domain_id}] {topic_name}: {data}"
-          self.sample_lines.append(line)
-
-          self.sample_lines = self.sample_lines[-20:]
-          self.output_widget.update("\n".join(self.sample_lines))
+      # Source address and domain per matched writer; they do not change
+      # between samples, so look them up once per publication handle
+      writer_sources = {}
+      topic_name = dynamic_reader.topic_name
+
+      # Wake only when the reader has data instead of polling it
+      async for data, info in dynamic_reader.take_async():
+        if not info.valid:
+          continue
+
+        publication_handle = info.publication_handle
+        writer_source = writer_sources.get(publication_handle)
+        if writer_source is None:
+          writer_source = sample_source(
+            dynamic_reader.matched_publication_participant_data(publication_handle))
+          writer_sources[publication_handle] = writer_source
+        source, domain_id = writer_source
+
+        data_text = str(data)
+        log_received_sample(dynamic_reader, data_text, source, domain_id)
+        line = f"[{source} D:{domain_id}] {topic_name}: {data_text}"
+        self.sample_lines.append(line)
+        # Samples received before the next refresh share one widget update
+        if not self.output_update_pending:
+          self.output_update_pending = True
+          self.call_after_refresh(self.update_output)
+    except asyncio.CancelledError:
+      raise
     except Exception as e:
       self.output_widget.update(f"Error: {e}")
 
+  def update_output(self):
+    self.output_update_pending = False
+    self.output_widget.update("\n".join(self.sample_lines))
+
+  async def cancel_subscription(self):
+    """Stop the subscribe_topic task before its reader is closed."""
+    task = self._sub_task
+    if task is not None and not task.done():
+      task.cancel()
+      # DDS: Wait for take_async() to detach its ReadCondition from the
+      # dispatcher WaitSet; the reader must not be closed while it is attached
+      await asyncio.gather(task, return_exceptions=True)
+
+
+def store_discovered_endpoint(data, kind, source):
+  """Record one DCPSPublication/DCPSSubscription sample as a Writer or Reader Endpoint.
+
+  source is the listener name used as the log prefix. Returns the Endpoint
+  when it was not known before, otherwise None.
+  """
+  # DDS: Extract unique key identifying this specific endpoint
+  key = builtin_key(data.key)
+  existing = endpoints.get(key)
+
+  type_name = data.type_name
+  topic_name = data.topic_name
+
+  # DDS: Get the participant key to associate this endpoint with its owning participant
+  p_key = builtin_key(data.participant_key)
+
+  # DDS: Extract QoS policies - these determine communication behavior and matching rules
+  # Matching: A writer and reader can only communicate if their QoS policies are compatible
+  reliability = data.reliability
+  durability = data.durability
+  deadline = data.deadline
+  ownership = data.ownership
+  presentation = data.presentation
+  partition = data.partition
+
+  # DDS: The type does not change over an endpoint's lifetime, and building
+  # it is the most expensive part of a sample; re-announcements reuse the
+  # one already stored
+  endpoint_type = existing.type if existing is not None and existing.type else data.type
+
+  # The arguments below still cross into the native sample, so skip them
+  # entirely when no handler would take the records
+  if logging.root.isEnabledFor(logging.INFO):
+    logging.info("[%s] Discovered %s: topic='%s', type='%s', key=%s", source, kind, topic_name, type_name, data.key.value)
+    logging.info("[%s] %s QoS - Reliability: %s, Durability: %s, Ownership: %s",
+                 source, kind, reliability.kind, durability.kind, ownership.kind)
+
+  endpoint = Endpoint(topic_name=topic_name, type_name=type_name, type=endpoint_type, kind=kind,
+                      p_key=p_key, key=key, reliability=reliability,
+                      durability=durability, deadline=deadline, ownership=ownership,
+                      presentation=presentation, partition=partition)
+
+  if store_endpoint(endpoint) is None:
+    logging.info("[%s] Added new %s endpoint: %s", source, kind, topic_name)
+    return endpoint
+  logging.debug("[%s] %s endpoint updated: %s", source, kind, topic_name)
+  return None
+
+
+def take_discovered_endpoints(reader, kind, source):
+  """Drain a builtin publication/subscription reader into the endpoint maps.
+
+  Returns the endpoints that were seen for the first time.
+  """
+  added = []
+  for data in reader.take_data():
+    endpoint = store_discovered_endpoint(data, kind, source)
+    if endpoint is not None:
+      added.append(endpoint)
+  return added
+
 
 # DDS: Builtin topic listeners for automatic endpoint discovery
 # These listeners are notified whenever a DataReader or DataWriter is discovered in the domain
@@ -1053,42 +1415,7 @@ class SubscriptionListener(dds.SubscriptionBuiltinTopicData.DataReaderListener):
   whenever a new reader appears, changes QoS, or disappears.
   """
   def on_data_available(self, reader):
-    for data, info in reader.take():
-      if info.valid:
-        # DDS: Extract unique key identifying this specific DataReader endpoint
-        key_list = data.key.value
-        key_string = str(key_list)
-
-        type_name = data.type_name
-        topic_name = data.topic_name
-
-        # DDS: Get the participant key to associate this reader with its owning participant
-        p_key_list = data.participant_key.value
-        p_key_string = str(p_key_list)
-
-        # DDS: Extract QoS policies - these determine communication behavior and matching rules
-        # Matching: A writer and reader can only communicate if their QoS policies are compatible
-        reliability = data.reliability
-        durability = data.durability
-        deadline = data.deadline
-        ownership = data.ownership
-        presentation = data.presentation
-        partition = data.partition
-
-        logging.info(f"[SubscriptionListener] Discovered Reader: topic='{topic_name}', type='{type_name}', key={key_string}")
-        logging.info(f"[SubscriptionListener] Reader QoS - Reliability: {reliability.kind}, Durability: {durability.kind}, Ownership: {ownership.kind}")
-
-        reader = Endpoint(topic_name=topic_name, type_name=type_name, type=data.type, kind="Reader", 
-                         p_key=p_key_string, key=key_string, reliability=reliability, 
-                         durability=durability, deadline=deadline, ownership=ownership,
-                         presentation=presentation, partition=partition)
-
-        existing = endpoints.get(key_string)
-        endpoints[key_string] = merge_endpoint(existing, reader)
-        if existing is None:
-          logging.info(f"[SubscriptionListener] Added new Reader endpoint: {topic_name}")
-        else:
-          logging.debug(f"[SubscriptionListener] Reader endpoint updated: {topic_name}")
+    take_discovered_endpoints(reader, "Reader", "SubscriptionListener")
 
 class PublicationListener(dds.PublicationBuiltinTopicData.DataReaderListener):
   """Listener for DataWriter discovery via DCPSPublication builtin topic.
@@ -1097,42 +1424,7 @@ class PublicationListener(dds.PublicationBuiltinTopicData.DataReaderListener):
   in the domain. This enables automatic discovery of data sources and their QoS.
   """
   def on_data_available(self, reader):
-    for data, info in reader.take():
-      if info.valid:
-        # DDS: Extract unique key identifying this specific DataWriter endpoint
-        key_list = data.key.value
-        key_string = str(key_list)
-
-        type_name = data.type_name
-        topic_name = data.topic_name
-
-        # DDS: Get the participant key to associate this writer with its owning participant
-        p_key_list = data.participant_key.value
-        p_key_string = str(p_key_list)
-
-        # DDS: Extract QoS policies from writer
-        # These policies must be compatible with reader QoS for matching to occur
-        reliability = data.reliability
-        durability = data.durability
-        deadline = data.deadline
-        ownership = data.ownership
-        presentation = data.presentation
-        partition = data.partition
-
-        logging.info(f"[PublicationListener] Discovered Writer: topic='{topic_name}', type='{type_name}', key={key_string}")
-        logging.info(f"[PublicationListener] Writer QoS - Reliability: {reliability.kind}, Durability: {durability.kind}, Ownership: {ownership.kind}")
-
-        writer = Endpoint(topic_name=topic_name, type_name=type_name, type=data.type, kind="Writer", 
-                         p_key=p_key_string, key=key_string, reliability=reliability, 
-                         durability=durability, deadline=deadline, ownership=ownership,
-                         presentation=presentation, partition=partition)
-
-        existing = endpoints.get(key_string)
-        endpoints[key_string] = merge_endpoint(existing, writer)
-        if existing is None:
-          logging.info(f"[PublicationListener] Added new Writer endpoint: {topic_name}")
-        else:
-          logging.debug(f"[PublicationListener] Writer endpoint updated: {topic_name}")
+    take_discovered_endpoints(reader, "Writer", "PublicationListener")
 
 
 class RTISPY(App):
@@ -1144,36 +1436,134 @@ class RTISPY(App):
     super().__init__()
     self.participant = participant
     self.interval = interval
+    # Bumped whenever update_participants sees a participant added, changed or removed
+    self.participants_version = 0
+    # Discovered participant InstanceHandle -> key in the participants map
+    self.participant_keys = {}
+    # While the app runs, builtin-topic discovery is serviced on its loop
+    # through this WaitSet instead of the listeners' middleware threads
+    self.discovery_waitset = dds.WaitSet()
+    # Triggered to wake the executor thread blocked in the WaitSet's wait so
+    # pump_discovery can return
+    self.discovery_stop = dds.GuardCondition()
+    self.discovery_task = None
+    # Set by the first action_quit so a repeated quit does not tear down twice
+    self.quitting = False
+    # Mounted ParticipantDetailScreens, each possibly holding a DataReader
+    self.detail_screens = set()
 
   def compose(self) -> ComposeResult:
     # Yield a placeholder container; actual screens are pushed in on_mount
     yield Container()
 
   async def on_mount(self) -> None:
+    self.start_discovery_pump()
     # logging.debug("[on_mount] refreshing participants list")
     self.update_participants(self.participant)
     self.set_interval(self.interval, lambda: self.update_participants(self.participant))
     await self.push_screen(ParticipantListScreen(self, self.participant))
 
 
+  def discovery_readers(self):
+    return (
+      (self.participant.publication_reader, "Writer", "PublicationListener"),
+      (self.participant.subscription_reader, "Reader", "SubscriptionListener"),
+    )
+
+  def start_discovery_pump(self):
+    """Move builtin publication/subscription discovery from the listeners onto this loop.
+
+    DDS: The listeners stay attached with an empty StatusMask so headless use
+    keeps working; a ReadCondition per builtin reader wakes the WaitSet instead.
+    """
+    for reader, kind, source in self.discovery_readers():
+      reader.set_listener(reader.listener, dds.StatusMask.NONE)
+      self.discovery_waitset += dds.ReadCondition(
+        reader, dds.DataState.any,
+        lambda _, reader=reader, kind=kind, source=source: self.endpoints_discovered(reader, kind, source))
+      # Anything that arrived before the condition was attached
+      take_discovered_endpoints(reader, kind, source)
+    # DCPSParticipant samples only signal that the participant list changed;
+    # the interval refresh remains as a fallback
+    self.discovery_waitset += dds.ReadCondition(
+      self.participant.participant_reader, dds.DataState.any, self.participant_discovery_changed)
+    self.discovery_stop.trigger_value = False
+    self.discovery_waitset += self.discovery_stop
+    self.discovery_task = asyncio.create_task(self.pump_discovery())
+
+  def endpoints_discovered(self, reader, kind, source):
+    """Take one wake's worth of endpoint samples and show the new ones in a single pass."""
+    added = take_discovered_endpoints(reader, kind, source)
+    if added and self.screen_stack and isinstance(self.screen_stack[-1], EndpointListScreen):
+      self.screen_stack[-1].add_endpoints(added)
+
+  def participant_discovery_changed(self, condition):
+    # The samples themselves are not needed (update_participants queries the
+    # participant), so return the loan instead of copying each one
+    with self.participant.participant_reader.take_loaned():
+      pass
+    self.update_participants(self.participant)
+
+  async def pump_discovery(self):
+    while not self.discovery_stop.trigger_value:
+      for condition in await self.discovery_waitset.wait_async():
+        # The listeners are muted while the pump runs, so one failing sample
+        # (e.g. a participant that left before it was looked up) must not
+        # stop discovery
+        try:
+          condition.dispatch()
+        except Exception as e:
+          logging.error(f"[pump_discovery] {e}")
+
+  async def stop_discovery_pump(self, restore_listeners=True):
+    """Stop the WaitSet pump and, unless restore_listeners is False, hand
+    builtin discovery back to the listener threads."""
+    task = self.discovery_task
+    if task is None:
+      return
+    self.discovery_task = None
+    # DDS: Cancelling the task would not wake the native wait; trigger the
+    # GuardCondition so the wait returns and the loop ends on its own
+    self.discovery_stop.trigger_value = True
+    await asyncio.gather(task, return_exceptions=True)
+    self.discovery_waitset.detach_all()
+    if not restore_listeners:
+      return
+    for reader, _, _ in self.discovery_readers():
+      reader.set_listener(reader.listener, dds.StatusMask.DATA_AVAILABLE)
+
   def update_participants(self, participant):
     """Update the list of discovered participants in the domain.
     
     DDS: Uses the DCPSParticipant builtin topic to get information about all
-    participants currently active in the domain. Called periodically to refresh.
+    participants currently active in the domain. Called when DCPSParticipant
+    data arrives and periodically as a fallback.
     """
+    # The interval timer can still fire after action_quit closed the participant
+    if self.quitting:
+      return
     # DDS: Get list of all discovered participant handles
     p_list = participant.discovered_participants()
+    changed = False
+
+    # Drop participants whose handles are no longer discovered
+    for p in self.participant_keys.keys() - set(p_list):
+        participants.pop(self.participant_keys.pop(p), None)
+        changed = True
 
     for p in p_list:
+        # Only participants not seen before need their data fetched
+        key = self.participant_keys.get(p)
+        if key is not None and key in participants:
+            continue
+
         # DDS: Get detailed data about each discovered participant
         data = participant.discovered_participant_data(p)
         name = data.participant_name.name
         
         # DDS: Extract IP address from unicast locator
         # Locators specify network addresses for communication
-        ip_list = data.default_unicast_locators[0].address[-4:]
-        ip = '.'.join(str(byte) for byte in ip_list)
+        ip = locator_ip(data.default_unicast_locators[0])
         
         # DDS: Extract RTPS GUID components for unique participant identification
         # GUID = GuidPrefix (12 bytes) + EntityId (4 bytes)
@@ -1188,42 +1578,55 @@ class RTISPY(App):
             rtps_app_id = 0
 
         participant_info = Participant(name, ip, rtps_host_id, rtps_app_id)
-        key_string = str(key_value)
-        if key_string not in participants:
-          logging.info(f"[participant_discovered] name='{name}' ip='{ip}' host_id={rtps_host_id} app_id={rtps_app_id}")
-        participants[key_string] = participant_info
+        key = builtin_key(data.key)
+        existing = participants.get(key)
+        if existing is None:
+          logging.info("[participant_discovered] name='%s' ip='%s' host_id=%s app_id=%s", name, ip, rtps_host_id, rtps_app_id)
+          changed = True
+        elif existing.name != name or existing.ip != ip:
+          changed = True
+        participants[key] = participant_info
+        self.participant_keys[p] = key
 
-    # Refresh ParticipantsScreen if it's the current screen
-    if self.screen_stack and isinstance(self.screen_stack[-1], ParticipantListScreen):
-        coro = self.screen_stack[-1].refresh_table()
-        if asyncio.iscoroutine(coro):
-            asyncio.create_task(coro)
+    if changed:
+      self.participants_version += 1
+
+    # Refresh ParticipantsScreen if it's the current screen; the diff is
+    # applied directly rather than through a task per tick
+    if changed and self.screen_stack and isinstance(self.screen_stack[-1], ParticipantListScreen):
+        self.screen_stack[-1].refresh_table()
 
   async def action_back(self) -> None:
     # logging.warning("[action_back] before await pop_screen")
     await self.pop_screen()
   
   async def action_quit(self) -> None:
-    # Clean up any ParticipantDetailScreen instances before quitting
+    if self.quitting:
+      return
+    self.quitting = True
+
+    # Stop everything that still uses a DataReader before quitting
+    for screen in list(self.detail_screens):
+      await screen.cancel_subscription()
+      screen.dynamic_reader = None
     for screen in self.screen_stack:
-      if isinstance(screen, ParticipantDetailScreen):
-        if screen.dynamic_reader is not None:
-          try:
-            logging.info(f"[action_quit] Closing DataReader for topic: {screen.endpoint.topic_name}")
-            screen.dynamic_reader.close()
-            screen.dynamic_reader = None
-          except Exception as e:
-            logging.error(f"[action_quit] Error closing DataReader: {e}")
-        
-        if screen.subscriber is not None:
-          try:
-            logging.info(f"[action_quit] Closing Subscriber")
-            screen.subscriber.close()
-            screen.subscriber = None
-          except Exception as e:
-            logging.error(f"[action_quit] Error closing Subscriber: {e}")
-    
-    # Now exit the application
+      if isinstance(screen, DistributedLoggerDialog):
+        await screen.stop_dispatch()
+    # The participant is about to close; re-enabling the listeners would let
+    # middleware threads call into Python while it is torn down
+    await self.stop_discovery_pump(restore_listeners=False)
+
+    # DDS: Close every reader, subscriber and topic the app created in one
+    # call rather than one reader at a time, then the participant itself so
+    # its discovery traffic and threads stop now rather than at teardown
+    try:
+      self.participant.close_contained_entities()
+      logging.info("[action_quit] Closed contained entities of the participant")
+      self.participant.close()
+      logging.info("[action_quit] Closed the participant")
+    except Exception as e:
+      logging.error(f"[action_quit] Error closing the participant: {e}")
+
     self.exit()
 
 def main():
@@ -1257,7 +1660,7 @@ def main():
 
   parser = argparse.ArgumentParser(description="Discover all readers and writers on a DDS domain.")
   parser.add_argument("-d", "--domain", type=int, default=None, help="DDS domain ID (prompts on startup; defaults to 1 when non-interactive)")
-  parser.add_argument("-i", "--interval", type=float, default=10, help="Refresh interval in seconds (default: 2.0)")
+  parser.add_argument("-i", "--interval", type=float, default=10, help="Fallback participant refresh interval in seconds (default: 10)")
   parser.add_argument("--debug-log", default=os.environ.get("RTI_SPY_DEBUG_LOG"), help="Optional path for discovery/subscription log output")
   args = parser.parse_args()
   domain_id = resolve_domain_id(args.domain)
@@ -1266,6 +1669,14 @@ def main():
   configure_logging(args.debug_log)
   participant = create_participant(domain_id, name="RTI SPY")
 
+  # Textual's App.run() starts its loop through asyncio.run, so an
+  # installed uvloop takes effect; it is optional and not a requirement
+  try:
+    import uvloop
+    uvloop.install()
+  except ImportError:
+    pass
+
   app = RTISPY(participant, interval=args.interval)
   app.run()
 